@@ -1 +1,16 @@
-from .dataset import NpyFile, Dataset, load_training_data, load_evaluation_data
+from .dataset import (
+    ItemCache,
+    NpyFile,
+    MmapNpyFile,
+    NpyColumn,
+    NpySlice,
+    ZlibColumn,
+    ZlibSlice,
+    Dataset,
+    scan_training_data,
+    load_training_data,
+    pack_training_data,
+    load_packed_training_data,
+    load_evaluation_data,
+    iterate_evaluation_data,
+)
@@ -1,14 +1,210 @@
 import numpy as np
 import pandas as pd
 import os
+import json
+import zlib
 import tempfile
 from pathlib import Path
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 from typing import Callable, Any
 from fnn.utils import logging
 
 logger = logging.get_logger(__name__)
 logger.setLevel(logging.INFO)
+
+TARGET_COLS = ['training', 'samples', 'stimuli', 'perspectives', 'modulations', 'units']
+MANIFEST = "manifest.json"
+
+# -------------- Data Cache --------------
+
+
+class ItemCache:
+    """Least Recently Used Cache of Memory Maps and Data Chunks"""
+
+    def __init__(self, nbytes=2**30, chunk_size=100, files=1024):
+        """
+        Parameters
+        ----------
+        nbytes : int
+            byte budget for cached data chunks
+        chunk_size : int
+            number of samples (first axis) in a data chunk
+        files : int
+            maximum number of memory maps kept open
+        """
+        assert nbytes >= 0
+        assert chunk_size > 0
+        assert files > 0
+
+        self.nbytes = int(nbytes)
+        self.chunk_size = int(chunk_size)
+        self.files = int(files)
+        self.clear()
+
+    def clear(self):
+        """Drop all memory maps and data chunks, and zero the counters"""
+        self.maps = OrderedDict()
+        self.chunks = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        return dict(nbytes=self.nbytes, chunk_size=self.chunk_size, files=self.files)
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def stats(self):
+        """
+        Returns
+        -------
+        dict
+            cache hits, misses, cached bytes, chunks, and open memory maps
+        """
+        return dict(hits=self.hits, misses=self.misses, nbytes=self.size, chunks=len(self.chunks), files=len(self.maps))
+
+    def mmap(self, key, open_fn):
+        """
+        Parameters
+        ----------
+        key : hashable
+            memory map identifier
+        open_fn : Callable[[], ND array]
+            opens the memory map
+
+        Returns
+        -------
+        ND array
+            memory map
+        """
+        data = self.maps.get(key)
+
+        if data is None:
+            data = self.maps[key] = open_fn()
+            if len(self.maps) > self.files:
+                self.maps.popitem(last=False)
+        else:
+            self.maps.move_to_end(key)
+
+        return data
+
+    def chunk(self, key, chunk, load_fn):
+        """
+        Parameters
+        ----------
+        key : hashable
+            data identifier
+        chunk : int
+            chunk index
+        load_fn : Callable[[int], ND array]
+            loads a data chunk given its index
+
+        Returns
+        -------
+        ND array
+            data chunk
+        """
+        data = self.chunks.get((key, chunk))
+
+        if data is None:
+            self.misses += 1
+            data = load_fn(chunk)
+
+            if data.nbytes <= self.nbytes:
+                self.chunks[key, chunk] = data
+                self.size += data.nbytes
+
+                while self.size > self.nbytes:
+                    _, evicted = self.chunks.popitem(last=False)
+                    self.size -= evicted.nbytes
+        else:
+            self.hits += 1
+            self.chunks.move_to_end((key, chunk))
+
+        return data
+
+    def read(self, key, length, index, open_fn):
+        """
+        Parameters
+        ----------
+        key : hashable
+            memory map identifier
+        length : int
+            length of the first axis
+        index : int | slice | 1D array
+            used to index the first axis
+        open_fn : Callable[[], ND array]
+            opens the memory map
+
+        Returns
+        -------
+        ND array
+            indexed data
+        """
+
+        def load(chunk):
+            start = chunk * self.chunk_size
+            return np.array(self.mmap(key, open_fn)[start : start + self.chunk_size])
+
+        mmap = self.mmap(key, open_fn)
+        load_fn = lambda chunk: self.chunk(key, chunk, load)
+
+        return gather_chunks(length, index, self.chunk_size, load_fn, shape=mmap.shape[1:], dtype=mmap.dtype)
+
+
+def gather_chunks(length, index, chunk_size, load_fn, shape=(), dtype=None):
+    """
+    Index the first axis of chunked data, loading only the chunks that are needed.
+    Parameters
+    ----------
+    length : int
+        length of the first axis
+    index : int | slice | 1D array
+        used to index the first axis
+    chunk_size : int
+        number of samples (first axis) in a chunk
+    load_fn : Callable[[int], ND array]
+        loads a data chunk given its index
+    shape : Sequence[int]
+        shape of the data after the first axis
+    dtype : np.dtype | None
+        data type
+
+    Returns
+    -------
+    ND array
+        indexed data
+    """
+    samples = np.arange(length)[index]
+    scalar = samples.ndim == 0
+    samples = samples.reshape(-1)
+
+    chunks = samples // chunk_size
+    unique = np.unique(chunks)
+
+    if unique.size == 0:
+        out = np.empty([0, *shape], dtype=dtype)
+    elif unique.size == 1:
+        (chunk,) = unique
+        out = load_fn(int(chunk))[samples - chunk * chunk_size]
+    else:
+        out = None
+        for chunk in unique:
+            data = load_fn(int(chunk))
+            mask = chunks == chunk
+
+            if out is None:
+                out = np.empty([samples.size, *data.shape[1:]], dtype=data.dtype)
+
+            out[mask] = data[samples[mask] - chunk * chunk_size]
+
+    return out[0] if scalar else out
+
+
 # -------------- Data Item --------------
 
 
@@ -52,6 +248,240 @@ class NpyFile(Item):
         os.rmdir(self.fd)
 
 
+class MmapNpyFile(Item):
+    """Memory-mapped Numpy File Data"""
+
+    def __init__(self, fp, shape=None, dtype=None, cache=None):
+        """
+        Parameters
+        ----------
+        fp : str | Path
+            path to an existing .npy file, read in place
+        shape : Sequence[int] | None
+            data shape, read from the file header if None
+        dtype : np.dtype | str | None
+            data type, read from the file header if None
+        cache : ItemCache | None
+            cache for memory maps and data chunks
+        """
+        self.fp = str(fp)
+        self.cache = cache
+
+        if shape is None or dtype is None:
+            data = np.load(self.fp, mmap_mode="r")
+            shape, dtype = data.shape, data.dtype
+
+        self.shape = tuple(map(int, shape))
+        self.dtype = np.dtype(dtype)
+
+    def _open(self):
+        return np.load(self.fp, mmap_mode="r")
+
+    def __getitem__(self, index):
+        if self.cache is None:
+            return self._open()[index]
+        else:
+            return self.cache.read(self.fp, self.shape[0], index, self._open)
+
+
+class NpyColumn:
+    """Packed Numpy Column"""
+
+    def __init__(self, fp):
+        """
+        Parameters
+        ----------
+        fp : str | Path
+            path to a .npy file holding the items of a column concatenated along the first axis
+        """
+        self.fp = str(fp)
+        self._data = None
+
+    @property
+    def data(self):
+        """
+        Returns
+        -------
+        np.memmap
+            read-only mapping of the column, opened once per process
+        """
+        if self._data is None:
+            self._data = np.load(self.fp, mmap_mode="r")
+        return self._data
+
+    def __getstate__(self):
+        return dict(self.__dict__, _data=None)
+
+
+class NpySlice(Item):
+    """Packed Numpy Column Slice"""
+
+    def __init__(self, column, offset, length, cache=None):
+        """
+        Parameters
+        ----------
+        column : NpyColumn
+            packed column
+        offset : int
+            offset of the item along the first axis of the column
+        length : int
+            length of the item along the first axis of the column
+        cache : ItemCache | None
+            cache for data chunks
+        """
+        self.column = column
+        self.offset = int(offset)
+        self.length = int(length)
+        self.cache = cache
+
+    @property
+    def shape(self):
+        return (self.length, *self.column.data.shape[1:])
+
+    @property
+    def dtype(self):
+        return self.column.data.dtype
+
+    def _open(self):
+        return self.column.data[self.offset : self.offset + self.length]
+
+    def __getitem__(self, index):
+        if self.cache is None:
+            return self._open()[index]
+        else:
+            return self.cache.read((self.column.fp, self.offset), self.length, index, self._open)
+
+
+class ZlibColumn:
+    """Packed Column of Zlib Compressed Chunks"""
+
+    def __init__(self, fp):
+        """
+        Parameters
+        ----------
+        fp : str | Path
+            path to the compressed chunks (.zlib), next to its chunk table (.chunks.npy) and metadata (.json)
+        """
+        self.fp = str(fp)
+        stem = os.path.splitext(self.fp)[0]
+
+        with open(stem + ".json", "r") as f:
+            meta = json.load(f)
+
+        self.shape = tuple(meta["shape"])
+        self.dtype = np.dtype(meta["dtype"])
+        self.chunk_size = int(meta["chunk_size"])
+        self.delta = bool(meta["delta"])
+        self.table = np.load(stem + ".chunks.npy")
+        self._data = None
+
+    @property
+    def data(self):
+        """
+        Returns
+        -------
+        np.memmap
+            read-only mapping of the compressed bytes, opened once per process
+        """
+        if self._data is None:
+            self._data = np.memmap(self.fp, dtype=np.uint8, mode="r")
+        return self._data
+
+    def __getstate__(self):
+        return dict(self.__dict__, _data=None)
+
+    def decode(self, chunk):
+        """
+        Parameters
+        ----------
+        chunk : int
+            chunk index
+
+        Returns
+        -------
+        ND array
+            [<= chunk_size, ...] -- decoded chunk
+        """
+        offset, nbytes = self.table[chunk]
+        data = zlib.decompress(self.data[offset : offset + nbytes])
+        data = np.frombuffer(data, dtype=self.dtype).reshape(-1, *self.shape)
+
+        if self.delta:
+            data = data.copy()
+            for i in range(1, len(data)):
+                np.add(data[i], data[i - 1], out=data[i])
+
+        return data
+
+    @staticmethod
+    def encode(data, delta=False, level=6):
+        """
+        Parameters
+        ----------
+        data : ND array
+            [<= chunk_size, ...] -- chunk to encode
+        delta : bool
+            store differences between consecutive samples (unsigned integer data only)
+        level : int
+            zlib compression level
+
+        Returns
+        -------
+        bytes
+            encoded chunk
+        """
+        data = np.ascontiguousarray(data)
+
+        if delta:
+            data = data.copy()
+            data[1:] -= data[:-1].copy()
+
+        return zlib.compress(data.tobytes(), level)
+
+
+class ZlibSlice(Item):
+    """Packed Column of Zlib Compressed Chunks Slice"""
+
+    def __init__(self, column, chunk, length, cache=None):
+        """
+        Parameters
+        ----------
+        column : ZlibColumn
+            packed column of compressed chunks
+        chunk : int
+            index of the first chunk of the item
+        length : int
+            length of the item along the first axis
+        cache : ItemCache | None
+            cache for decoded chunks
+        """
+        self.column = column
+        self.chunk = int(chunk)
+        self.length = int(length)
+        self.cache = cache
+
+    @property
+    def shape(self):
+        return (self.length, *self.column.shape)
+
+    @property
+    def dtype(self):
+        return self.column.dtype
+
+    def _decode(self, chunk):
+        return self.column.decode(self.chunk + chunk)
+
+    def __getitem__(self, index):
+        if self.cache is None:
+            load = self._decode
+        else:
+            load = lambda chunk: self.cache.chunk((self.column.fp, self.chunk), chunk, self._decode)
+
+        return gather_chunks(
+            self.length, index, self.column.chunk_size, load, shape=self.column.shape, dtype=self.column.dtype
+        )
+
+
 # -------------- Data Set --------------
 
 
@@ -71,7 +501,7 @@ class Dataset:
         assert np.unique(dataframe.index).size == len(dataframe), "Index is not unique"
 
         for item in self.dataitems:
-            assert isinstance(dataframe[item][0], Item), f"{dataframe[item][0]} is not an instance of Item"
+            assert isinstance(dataframe[item].iloc[0], Item), f"{dataframe[item].iloc[0]} is not an instance of Item"
 
     @property
     def datainfo(self):
@@ -119,51 +549,345 @@ class Dataset:
         else:
             return {item: data[item][index] for item in self.dataitems}
 
+    def load_batch(self, keys, indexes, out=None):
+        """
+        Parameters
+        ----------
+        keys : Sequence[hashable]
+            [N] -- labels for DataFrame.loc
+        indexes : Sequence[1D array]
+            N x [T] -- used to index the data items
+        out : dict[str, ND array] | None
+            preallocated [T, N, ...] data items to write into, allocated if missing
+
+        Returns
+        -------
+        dict[str, ND array]
+            [T, N, ...] -- data items
+        """
+        rows = self.df.index.get_indexer(keys)
+        if (rows < 0).any():
+            raise KeyError(f"Keys not found: {[k for k, r in zip(keys, rows) if r < 0]}")
+
+        out = dict() if out is None else out
+        columns = {item: self.df[item].to_numpy()[rows] for item in self.dataitems}
+
+        for n, index in enumerate(indexes):
+            index = _to_slice(index)
+
+            for item, column in columns.items():
+                data = column[n][index]
+
+                if item not in out:
+                    out[item] = np.empty([len(data), len(rows), *data.shape[1:]], dtype=data.dtype)
+
+                out[item][:, n] = data
+
+        return out
+
+
+def _to_slice(index):
+    """
+    Parameters
+    ----------
+    index : 1D array
+        used to index a data item
+
+    Returns
+    -------
+    slice | 1D array
+        equivalent slice if the index is contiguous and increasing, otherwise the index
+    """
+    index = np.asarray(index)
+    if index.size and (index.size == 1 or (np.diff(index) == 1).all()):
+        return slice(int(index[0]), int(index[-1]) + 1)
+    else:
+        return index
+
 # -------------- Training and evaluating new digital twin --------------
 
-def load_training_data(directory, max_items=None):
+def _scan_column(col_path, executor, cached=None, max_items=None):
+    """
+    Scan the .npy files of a dataset column.
+
+    Every scanned file is stat'ed, so that files overwritten in place are detected. The manifest saves reading the
+    file headers (or values) of unchanged files, not the stat calls.
+    Parameters
+    ----------
+    col_path : Path
+        column directory
+    executor : concurrent.futures.Executor
+        executor used to read the files
+    cached : dict | None
+        previous manifest entry of the column, files with unchanged mtimes and sizes are not read again
+    max_items : int | None
+        maximum number of files to scan, in order of file name
+    Returns
+    -------
+    List[concurrent.futures.Future]
+        futures of (file name, file entry)
+    """
+    files = dict() if cached is None else cached["files"]
+    info = col_path.name in ['training', 'samples']
+
+    def scan(entry):
+        stat = entry.stat()
+        mtime, size = stat.st_mtime_ns, stat.st_size
+        prev = files.get(entry.name)
+
+        if prev is not None and prev["mtime"] == mtime and prev.get("size") == size:
+            return entry.name, prev
+
+        if info:
+            return entry.name, dict(mtime=mtime, size=size, value=np.load(entry.path).item())
+        else:
+            item = MmapNpyFile(entry.path)
+            return entry.name, dict(mtime=mtime, size=size, shape=list(item.shape), dtype=item.dtype.str)
+
+    with os.scandir(col_path) as it:
+        entries = sorted((entry for entry in it if entry.is_file()), key=lambda entry: entry.name)
+
+    return [executor.submit(scan, entry) for entry in entries[:max_items]]
+
+
+def scan_training_data(directory, workers=8, refresh=False, max_items=None):
+    """
+    Scan dataset to train digital twin, using and updating the manifest in the directory.
+
+    Every scanned file is stat'ed and compared against the manifest. Only new or changed files are read.
+    Parameters
+    ----------
+    directory : str | Path
+        directory containing the dataset files
+    workers : int
+        number of threads used to scan the files
+    refresh : bool
+        ignore the manifest and rescan every file
+    max_items : int | None
+        maximum number of files to scan per column
+    Returns
+    -------
+    dict[str, dict[str, dict]]
+        column name -> trial id -> file entry (`mtime`, `size`, and either `value` or `shape` and `dtype`)
+    """
+    directory = Path(directory)
+    manifest_path = directory / MANIFEST
+
+    manifest = dict()
+    if manifest_path.exists() and not refresh:
+        try:
+            with open(manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read manifest, rescanning: {e}")
+
+    columns = dict()
+    pending = dict()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        for col_path in sorted(directory.iterdir()):
+            col_name = col_path.name
+            if col_name not in TARGET_COLS or not col_path.is_dir():
+                continue
+
+            pending[col_name] = _scan_column(col_path, executor, manifest.get(col_name), max_items)
+
+        for col_name, futures in pending.items():
+            files = [future.result() for future in tqdm(futures, desc=f"Scanning {col_name}")]
+            columns[col_name] = dict(files=dict(files))
+
+    if max_items is None:
+        updated = columns
+    else:
+        updated = {
+            col_name: dict(files={**manifest.get(col_name, dict(files=dict()))["files"], **column["files"]})
+            for col_name, column in columns.items()
+        }
+
+    if updated != manifest:
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{MANIFEST}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(updated, f)
+                os.replace(tmp_path, manifest_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write manifest: {e}")
+
+    return {
+        col_name: {Path(name).stem: entry for name, entry in column["files"].items()}
+        for col_name, column in columns.items()
+    }
+
+
+def load_training_data(directory, max_items=None, copy=False, workers=8, refresh=False, cache=None):
     """
     Load dataset to train digital twin.
     Parameters
     ----------
     directory : str | Path
         directory containing the dataset files
+    max_items : int | None
+        maximum number of items to load per column
+    copy : bool
+        copy data items into temporary files (NpyFile) instead of reading the source files in place (MmapNpyFile)
+    workers : int
+        number of threads used to scan the files
+    refresh : bool
+        ignore the manifest and rescan every file
+    cache : ItemCache | None
+        cache shared by the data items, ignored if copy is True
     Returns
     -------
     Dataset
         loaded dataset
     """
     directory = Path(directory)
-    target_cols = ['training', 'samples', 'stimuli', 'perspectives', 'modulations', 'units']
+    columns = scan_training_data(directory, workers=workers, refresh=refresh, max_items=max_items)
+
     col_data = {}
-    for col_path in sorted(directory.iterdir()):
-        col_name = col_path.stem
-        if col_name not in target_cols or not col_path.is_dir():
-            continue
-
-        all_files = sorted(col_path.iterdir())
-        if max_items is not None:
-            all_files = all_files[:max_items]
-        value_dict = {}
-        for file_path in tqdm(all_files, desc=f"Loading {col_name}"):
-            if col_name in ['training', 'samples']:
-                value_dict[file_path.stem] = np.load(file_path).item()
-            else:
-                value_dict[file_path.stem] = NpyFile(np.load(file_path))
-
-        col_data[col_name] = value_dict
-        
-    df = pd.DataFrame(col_data)
-    df.index.name = 'trial_id'
-    
-    if df.isna().any().any():
-        missing = {
-            col: df.index[df[col].isna()].tolist()
-            for col in df.columns if df[col].isna().any()
-        }
+    for col_name, entries in columns.items():
+        trial_ids = sorted(entries)
+
+        if col_name in ['training', 'samples']:
+            col_data[col_name] = {t: entries[t]["value"] for t in trial_ids}
+        else:
+            col_path = directory / col_name
+            col_data[col_name] = {
+                t: MmapNpyFile(
+                    col_path / f"{t}.npy", shape=entries[t]["shape"], dtype=entries[t]["dtype"], cache=cache
+                )
+                for t in trial_ids
+            }
+            if copy:
+                col_data[col_name] = {
+                    t: NpyFile(item[:]) for t, item in tqdm(col_data[col_name].items(), desc=f"Loading {col_name}")
+                }
+
+    trial_ids = sorted(set().union(*col_data.values()))
+    missing = {
+        col: sorted(set(trial_ids) - set(values))
+        for col, values in col_data.items()
+        if len(values) < len(trial_ids)
+    }
+    if missing:
         raise ValueError(f"Missing data detected: {missing}")
 
-    return Dataset(df[target_cols])
+    df = pd.DataFrame({col: pd.Series(values) for col, values in col_data.items()}, index=trial_ids)
+    df.index.name = 'trial_id'
+
+    return Dataset(df[TARGET_COLS])
+
+
+def pack_training_data(source, target, max_items=None, compress=(), chunk_size=10, delta=False, level=6):
+    """
+    Convert a training dataset from per-trial files into packed columns.
+    Parameters
+    ----------
+    source : str | Path
+        directory containing the per-trial dataset files (see load_training_data)
+    target : str | Path
+        directory to write the packed dataset to
+    max_items : int | None
+        maximum number of items to pack per column
+    compress : Sequence[str]
+        columns to store as zlib compressed chunks, e.g. ["stimuli"]
+    chunk_size : int
+        number of samples in a compressed chunk
+    delta : bool
+        store differences between consecutive samples in compressed chunks (unsigned integer columns only)
+    level : int
+        zlib compression level
+    """
+    dataset = load_training_data(source, max_items=max_items)
+    target = Path(target)
+    target.mkdir(parents=True, exist_ok=True)
+
+    index = dataset.df[list(dataset.datainfo)].copy()
+
+    for col_name in sorted(dataset.dataitems):
+        items = dataset.df[col_name]
+        (shape,) = {item.shape[1:] for item in items}
+        (dtype,) = {item.dtype for item in items}
+
+        lengths = np.array([item.shape[0] for item in items])
+        index[f"{col_name}_length"] = lengths
+
+        if col_name in compress:
+            col_delta = delta and np.issubdtype(dtype, np.unsignedinteger)
+            chunks = []
+            firsts = []
+
+            with open(target / f"{col_name}.zlib", "wb") as f:
+                for item in tqdm(items, desc=f"Compressing {col_name}"):
+                    firsts.append(len(chunks))
+
+                    for start in range(0, item.shape[0], chunk_size):
+                        data = ZlibColumn.encode(item[start : start + chunk_size], delta=col_delta, level=level)
+                        chunks.append([f.tell(), len(data)])
+                        f.write(data)
+
+            np.save(target / f"{col_name}.chunks.npy", np.array(chunks, dtype=np.int64).reshape(-1, 2))
+
+            with open(target / f"{col_name}.json", "w") as f:
+                meta = dict(shape=list(shape), dtype=dtype.str, chunk_size=int(chunk_size), delta=bool(col_delta))
+                json.dump(meta, f)
+
+            index[f"{col_name}_chunk"] = firsts
+
+        else:
+            offsets = np.cumsum(lengths) - lengths
+
+            data = np.lib.format.open_memmap(
+                target / f"{col_name}.npy", mode="w+", dtype=dtype, shape=(int(lengths.sum()), *shape)
+            )
+            for item, offset, length in tqdm(zip(items, offsets, lengths), total=len(items), desc=f"Packing {col_name}"):
+                data[offset : offset + length] = item[:]
+            data.flush()
+            del data
+
+            index[f"{col_name}_offset"] = offsets
+
+    index.to_csv(target / "index.csv")
+
+
+def load_packed_training_data(directory, cache=None):
+    """
+    Load packed dataset to train digital twin.
+    Parameters
+    ----------
+    directory : str | Path
+        directory containing the packed dataset (see pack_training_data)
+    cache : ItemCache | None
+        cache shared by the data items
+    Returns
+    -------
+    Dataset
+        loaded dataset
+    """
+    directory = Path(directory)
+    index = pd.read_csv(directory / "index.csv", dtype={"trial_id": str}).set_index("trial_id")
+
+    col_data = {"training": index.training, "samples": index.samples}
+    for col_name in ['stimuli', 'perspectives', 'modulations', 'units']:
+        if f"{col_name}_chunk" in index:
+            column = ZlibColumn(directory / f"{col_name}.zlib")
+            col_data[col_name] = [
+                ZlibSlice(column, chunk, length, cache=cache)
+                for chunk, length in zip(index[f"{col_name}_chunk"], index[f"{col_name}_length"])
+            ]
+        else:
+            column = NpyColumn(directory / f"{col_name}.npy")
+            col_data[col_name] = [
+                NpySlice(column, offset, length, cache=cache)
+                for offset, length in zip(index[f"{col_name}_offset"], index[f"{col_name}_length"])
+            ]
+
+    return Dataset(pd.DataFrame(col_data, index=index.index))
 
 
 def recursive_load(path: Path, load_fn: Callable[[Path], Any] = None):
@@ -194,17 +918,25 @@ def recursive_load(path: Path, load_fn: Callable[[Path], Any] = None):
     return result
 
 
-def load_evaluation_data(directory: Path):
+def load_evaluation_data(directory: Path, mmap=False):
     """
     Load dataset to evaluate digital twin.
     Parameters
     ----------
     directory : str | Path
         directory containing the dataset files
+    mmap : bool
+        memory-map the files instead of reading them into memory
     Returns
     -------
         dictionary with contents of directory indexed by subdirectory name
     """
+    directory = Path(directory)
+    if mmap:
+        load_fn = lambda path: np.load(path, mmap_mode="r")
+    else:
+        load_fn = np.load
+
     contents = {}
     subdirs = []
     for subdir in directory.iterdir():
@@ -212,5 +944,52 @@ def load_evaluation_data(directory: Path):
             subdirs.append(subdir)
     for subdir in tqdm(subdirs, desc="Subdirectories"):
             logger.info(f"Loading {subdir.name}...")
-            contents[subdir.name] = recursive_load(subdir, load_fn=np.load)
+            contents[subdir.name] = recursive_load(subdir, load_fn=load_fn)
     return contents
+
+
+def iterate_evaluation_data(directory: Path, columns=None, prefetch=2):
+    """
+    Stream dataset to evaluate digital twin, one (video, repeat) at a time.
+    Parameters
+    ----------
+    directory : str | Path
+        directory containing the dataset files
+    columns : Sequence[str] | None
+        subdirectories to load, all if None
+    prefetch : int
+        number of (video, repeat) items loaded ahead in a background thread
+    Yields
+    ------
+    int
+        video index
+    int
+        repeat index
+    dict[str, ND array]
+        contents of the (video, repeat) indexed by subdirectory name
+    """
+    assert prefetch > 0
+
+    directory = Path(directory)
+    paths = {
+        subdir.name: recursive_load(subdir)
+        for subdir in sorted(directory.iterdir())
+        if subdir.is_dir() and (columns is None or subdir.name in columns)
+    }
+    (repeats,) = {tuple(map(len, videos)) for videos in paths.values()}
+    items = [(i, j) for i, n in enumerate(repeats) for j in range(n)]
+
+    def load(item):
+        i, j = item
+        return {col: np.load(videos[i][j]) for col, videos in paths.items()}
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        futures = deque(executor.submit(load, item) for item in items[:prefetch])
+
+        for n, (i, j) in enumerate(items):
+            data = futures.popleft().result()
+
+            if n + prefetch < len(items):
+                futures.append(executor.submit(load, items[n + prefetch]))
+
+            yield i, j, data
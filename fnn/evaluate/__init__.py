@@ -35,6 +35,9 @@ def format_responses(responses, burnin_frames=0, pad=True):
     """
     Removes burn-in frames, optionally pads, and reshapes the responses.
 
+    Responses are copied one at a time into the output, so memory-mapped responses
+    (e.g. from fnn.data.load_evaluation_data with mmap=True) are never all held in memory.
+
     Parameters
     ----------
     responses : list of lists of arrays (n_video x n_repeats x n_samples x n_units)
@@ -52,11 +55,27 @@ def format_responses(responses, burnin_frames=0, pad=True):
         Shape: n_units x n_repeats x n_samples_concat
             where n_samples_concat = (n_samples - burnin_frames) * n_video
     """
-    if pad:
-        responses = pad_responses(responses)
-    responses = responses.transpose(3, 1, 0, 2) # n_units x n_repeats x n_video x n_samples
-    responses = responses[..., burnin_frames:] # n_units x n_repeats x n_video x (n_samples - burnin_frames)
-    return responses.reshape(responses.shape[0], responses.shape[1], -1) # n_units x n_repeats x (n_samples - burnin_frames) * n_video
+    n_video = len(responses)
+    n_repeats = [len(repeats) for repeats in responses]
+    max_repeats = max(n_repeats)
+
+    if not pad and min(n_repeats) != max_repeats:
+        raise ValueError("Uneven repeats, set pad=True to fill in NaNs")
+
+    (shape,) = {np.shape(r) for repeats in responses for r in repeats}
+    n_samples, n_units = shape
+    n_kept = n_samples - burnin_frames
+
+    first = next(r for repeats in responses for r in repeats)
+    dtype = np.result_type(np.asarray(first).dtype, np.float32)
+
+    formatted = np.full([n_units, max_repeats, n_video * n_kept], np.nan, dtype=dtype)
+
+    for i, repeats in enumerate(responses):
+        for j, response in enumerate(repeats):
+            formatted[:, j, i * n_kept : (i + 1) * n_kept] = np.asarray(response[burnin_frames:]).T
+
+    return formatted # n_units x n_repeats x (n_samples - burnin_frames) * n_video
 
 
 def compute_cc_max_unit(unit_responses: np.ndarray):
@@ -7,7 +7,8 @@ import requests
 from pathlib import Path
 from tqdm import tqdm
 from fnn.microns.build import network
-from fnn.microns.load import params, units, unit_ids
+from fnn.microns.load import params, core_params, scan_params, units, unit_ids
+from fnn.model.networks import MultiVisual
 from fnn.utils import logging
 
 BASE_URL = "https://bossdb-open-data.s3.amazonaws.com/iarpa_microns/minnie/functional_data/foundation_model/"
@@ -77,7 +78,7 @@ def download_data(directory=None, verbose=True):
         _ = download(README_URL, os.path.join(directory, "README.md"), verbose=verbose)
 
 
-def scan(session, scan_idx, cuda=True, directory=None):
+def scan(session, scan_idx, cuda=True, directory=None, grid_cache=0):
     """
     Parameters
     ----------
@@ -89,6 +90,8 @@ def scan(session, scan_idx, cuda=True, directory=None):
         use cuda if available
     directory : os.PathLike | None
         directory for model parameters and metadata. defaults to current working directory
+    grid_cache : int
+        number of cached perspective sampling grids, 0 disables the cache. only useful for repeated perspectives
 
     Returns
     -------
@@ -100,7 +103,7 @@ def scan(session, scan_idx, cuda=True, directory=None):
     directory = directory or os.getcwd()
     load = lambda f: f(session, scan_idx, directory)
 
-    model = network(load(units))
+    model = network(load(units), grid_cache=grid_cache)
     model.load_state_dict(load(params))
 
     if cuda and torch.cuda.is_available():
@@ -109,6 +112,56 @@ def scan(session, scan_idx, cuda=True, directory=None):
     return model, load(unit_ids)
 
 
+def scans(keys, cuda=True, directory=None, grid_cache=0):
+    """
+    Parameters
+    ----------
+    keys : Sequence[Tuple[int, int]]
+        (session, scan_idx) of each scan
+    cuda : bool
+        use cuda if available
+    directory : os.PathLike | None
+        directory for model parameters and metadata. defaults to current working directory
+    grid_cache : int
+        number of cached perspective sampling grids, 0 disables the cache. only useful for repeated perspectives
+
+    Returns
+    -------
+    fnn.model.networks.MultiVisual
+        predictive models of the experimental scans, sharing one core, keyed by "{session}-{scan_idx}"
+    Dict[str, pd.DataFrame]
+        dataframes mapping readout ids to unit ids, keyed by "{session}-{scan_idx}"
+    """
+    directory = directory or os.getcwd()
+    shared = core_params(directory)
+
+    networks = dict()
+    ids = dict()
+    core = None
+
+    for session, scan_idx in keys:
+        load = lambda f: f(session, scan_idx, directory)
+        key = f"{session}-{scan_idx}"
+
+        model = network(load(units), grid_cache=grid_cache)
+        if core is None:
+            core = model.core
+        else:
+            model.core = core
+
+        model.load_state_dict(dict(**shared, **load(scan_params)))
+
+        networks[key] = model
+        ids[key] = load(unit_ids)
+
+    model = MultiVisual(networks)
+
+    if cuda and torch.cuda.is_available():
+        model.to(device="cuda")
+
+    return model, ids
+
+
 def load_network_from_params(path_to_params, cuda=True):
     """
     Loads a neural network model from saved parameters.
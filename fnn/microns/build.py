@@ -15,12 +15,14 @@ from fnn.model.units import Poisson
 from fnn.model.networks import Visual
 
 
-def network(units):
+def network(units, grid_cache=0):
     """
     Parameters
     ----------
     units : int
         number of units
+    grid_cache : int
+        number of cached perspective sampling grids, 0 disables the cache
 
     Returns
     -------
@@ -61,6 +63,7 @@ def network(units):
         monitor_pixel=StaticPower(power=1.7),
         retina=Angular(degrees=75),
         retina_pixel=SigmoidPower(),
+        grid_cache=grid_cache,
     )
     modulation = MlpLstm(
         mlp_features=16,
@@ -20,10 +20,41 @@ def params(session, scan_idx, directory):
         model parameters
     """
 
-    def load(path):
-        return torch.load(os.path.join(directory, path), map_location="cpu")
+    return dict(**core_params(directory), **scan_params(session, scan_idx, directory))
 
-    return dict(**load("params_core.pt"), **load(f"params_{session}_{scan_idx}.pt"))
+
+def core_params(directory):
+    """
+    Parameters
+    ----------
+    directory : os.PathLike
+        data directory
+
+    Returns
+    -------
+    Dict[str, torch.Tensor]
+        model parameters shared by all scans
+    """
+    return torch.load(os.path.join(directory, "params_core.pt"), map_location="cpu")
+
+
+def scan_params(session, scan_idx, directory):
+    """
+    Parameters
+    ----------
+    session : int
+        scan session
+    scan_idx : int
+        scan index
+    directory : os.PathLike
+        data directory
+
+    Returns
+    -------
+    Dict[str, torch.Tensor]
+        model parameters specific to the scan
+    """
+    return torch.load(os.path.join(directory, f"params_{session}_{scan_idx}.pt"), map_location="cpu")
 
 
 def units(session, scan_idx, directory):
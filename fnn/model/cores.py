@@ -37,22 +37,22 @@ class Core(Module):
         Parameters
         ----------
         perspective : Tensor
-            [N, S*P, H, W] -- stream is None
+            [N, S*P, H, W] | [N, S*P, T, H, W] (clip) -- stream is None
                 or
-            [N, P, H, W] -- stream is int
+            [N, P, H, W] | [N, P, T, H, W] (clip) -- stream is int
         modulation : Tensor
-            [N, S*M] -- stream is None
+            [N, S*M] | [N, S*M, T] (clip) -- stream is None
                 or
-            [N, M] -- stream is int
+            [N, M] | [N, M, T] (clip) -- stream is int
         stream : int | None
             specific stream (int) or all streams (None)
 
         Returns
         -------
         Tensor
-            [N, S*C, H', W'] -- stream is None
+            [N, S*C, H', W'] | [N, S*C, T, H', W'] (clip) -- stream is None
                 or
-            [N, C, H', W'] -- stream is int
+            [N, C, H', W'] | [N, C, T, H', W'] (clip) -- stream is int
         """
         raise NotImplementedError()
 
@@ -115,24 +115,31 @@ class FeedforwardRecurrent(Core):
         Parameters
         ----------
         perspective : Tensor
-            [N, S*P, H, W] -- stream is None
+            [N, S*P, H, W] | [N, S*P, T, H, W] (clip) -- stream is None
                 or
-            [N, P, H, W] -- stream is int
+            [N, P, H, W] | [N, P, T, H, W] (clip) -- stream is int
         modulation : Tensor
-            [N, S*M] -- stream is None
+            [N, S*M] | [N, S*M, T] (clip) -- stream is None
                 or
-            [N, M] -- stream is int
+            [N, M] | [N, M, T] (clip) -- stream is int
         stream : int | None
             specific stream (int) or all streams (None)
 
         Returns
         -------
         Tensor
-            [N, S*C, H', W'] -- stream is None
+            [N, S*C, H', W'] | [N, S*C, T, H', W'] (clip) -- stream is None
                 or
-            [N, C, H', W'] -- stream is int
+            [N, C, H', W'] | [N, C, T, H', W'] (clip) -- stream is int
         """
         f = self.feedforward([perspective], stream=stream)
+
+        if f.ndim == 5:
+            r = []
+            for _f, m in zip(f.unbind(2), modulation.unbind(2)):
+                r.append(self.recurrent([_f, m[:, :, None, None]], stream=stream))
+            return torch.stack(r, dim=2)
+
         m = modulation[:, :, None, None]
         r = self.recurrent([f, m], stream=stream)
         return r
@@ -190,35 +197,36 @@ class FeedforwardRecurrentDecorr(FeedforwardRecurrent):
         Parameters
         ----------
         perspective : Tensor
-            [N, S*P, H, W] -- stream is None
+            [N, S*P, H, W] | [N, S*P, T, H, W] (clip) -- stream is None
                 or
-            [N, P, H, W] -- stream is int
+            [N, P, H, W] | [N, P, T, H, W] (clip) -- stream is int
         modulation : Tensor
-            [N, S*M] -- stream is None
+            [N, S*M] | [N, S*M, T] (clip) -- stream is None
                 or
-            [N, M] -- stream is int
+            [N, M] | [N, M, T] (clip) -- stream is int
         stream : int | None
             specific stream (int) or all streams (None)
 
         Returns
         -------
         Tensor
-            [N, S*C, H', W'] -- stream is None
+            [N, S*C, H', W'] | [N, S*C, T, H', W'] (clip) -- stream is None
                 or
-            [N, C, H', W'] -- stream is int
+            [N, C, H', W'] | [N, C, T, H', W'] (clip) -- stream is int
         """
         x = super().forward(perspective=perspective, modulation=modulation, stream=stream)
 
         if self.training:
-            N, _, H, W = x.shape
-            S = self.streams if stream is None else 1
+            for _x in x.unbind(2) if x.ndim == 5 else [x]:
+                N, _, H, W = _x.shape
+                S = self.streams if stream is None else 1
 
-            p = x.view(N, S, self.channels, H, W)
-            p = torch.einsum("N S C H W -> S C N H W", p).flatten(2)
+                p = _x.view(N, S, self.channels, H, W)
+                p = torch.einsum("N S C H W -> S C N H W", p).flatten(2)
 
-            if self.decorr_rate:
-                p = p[:, :, torch.rand(N * H * W) > (1 - self.decorr_rate)]
+                if self.decorr_rate:
+                    p = p[:, :, torch.rand(N * H * W) > (1 - self.decorr_rate)]
 
-            self.past.append(p)
+                self.past.append(p)
 
         return x
@@ -3,7 +3,6 @@ import torch
 from torch import nn
 from itertools import chain
 from functools import reduce
-from collections import deque
 from .parameters import Parameter, ParameterList
 from .modules import Module, ModuleList
 from .utils import add, cat_groups
@@ -58,6 +57,15 @@ class Dropout(Module):
     def _reset(self):
         self.mask = None
 
+    def _get_state(self):
+        if self.mask is None:
+            return dict()
+        else:
+            return {"mask": self.mask}
+
+    def _set_state(self, state, stream=None):
+        self.mask = state.get("mask")
+
     @property
     def p(self):
         if self.training:
@@ -77,22 +85,22 @@ class Dropout(Module):
         Parameters
         ----------
         x : Tensor
-            [N, C, H, W]
+            [N, C, H, W] | [N, C, T, H, W]
 
         Returns
         -------
         Tensor
-            [N, C, H, W]
+            [N, C, H, W] | [N, C, T, H, W]
         """
         if not self.p:
             return x
 
         if self.mask is None:
-            N, C, _, _ = x.shape
+            N, C = x.shape[:2]
             rand = torch.rand([N, C], device=x.device)
             self.mask = (rand > self.p) * self.scale
 
-        return torch.einsum("N C H W , N C -> N C H W", x, self.mask)
+        return torch.einsum("N C ... , N C -> N C ...", x, self.mask)
 
     def extra_repr(self):
         return f"p={self.p:.3g}"
@@ -204,12 +212,14 @@ class Conv(Module):
         self.eps = float(eps)
         self.wnorm = bool(wnorm)
 
+        pad = lambda x: [self.padding] * 4 + [0, 0] * (x.ndim - 4)
+
         if self.pad is None:
             self.pad_fn = lambda x: x
         elif self.pad == "zeros":
-            self.pad_fn = lambda x: nn.functional.pad(x, pad=[self.padding] * 4)
+            self.pad_fn = lambda x: nn.functional.pad(x, pad=pad(x))
         elif self.pad == "replicate":
-            self.pad_fn = lambda x: nn.functional.pad(x, pad=[self.padding] * 4, mode="replicate")
+            self.pad_fn = lambda x: nn.functional.pad(x, pad=pad(x), mode="replicate")
         else:
             raise ValueError("Invalid pad mode")
 
@@ -245,11 +255,100 @@ class Conv(Module):
             self.biases.decay = False
             self.biases.norm_dim = 1
 
+        self.register_buffer("folded_weight", None, persistent=False)
+        self.register_buffer("folded_bias", None, persistent=False)
+
         self.past = dict()
 
     def _reset(self):
         self.past.clear()
 
+    def _compile(self, mode=True):
+        self.folded_weight = None
+        self.folded_bias = None
+
+        if mode:
+            with torch.no_grad():
+                self.folded_weight = self.weight()
+                self.folded_bias = self._bias()
+
+    def _detach(self):
+        if self.past:
+            self.past["weight"] = self.weight(self.past["stream"])
+            self.past["bias"] = self._bias(self.past["stream"])
+
+            if self.past["history"] is not None:
+                self.past["history"] = self.past["history"].detach()
+
+    def _get_state(self):
+        if self.past and self.past["history"] is not None:
+            window = self.window()
+            if self.past["history"].size(2) == 2 * self.temporal:
+                window = window.clone()
+            return {"history": window}
+        else:
+            return dict()
+
+    def _set_state(self, state, stream=None):
+        if self.past and self.past["stream"] != stream:
+            self.past.clear()
+
+        if "history" in state:
+            if not self.past:
+                self.past["stream"] = stream
+                self.past["weight"] = self.weight(stream)
+                self.past["bias"] = self._bias(stream)
+            self.past["history"] = state["history"]
+            self.past["index"] = -1
+
+        elif self.temporal > 1:
+            self.past.clear()
+
+    def window(self):
+        """
+        Returns
+        -------
+        5D Tensor
+            [N, C, T, H, W] -- temporal history, oldest to newest frame
+        """
+        k = self.past["index"]
+        return self.past["history"][:, :, k + 1 : k + 1 + self.temporal]
+
+    def push(self, x):
+        """Writes a frame into the circular history buffer in place
+
+        The buffer holds every frame twice, [N, C, 2*T, H, W], so that the latest T frames are always a
+        contiguous slice. It is only written in place when no gradients flow through the history.
+
+        Parameters
+        ----------
+        x : 4D Tensor
+            [N, C, H, W] -- padded frame
+
+        Returns
+        -------
+        5D Tensor
+            [N, C, T, H, W] -- temporal history, oldest to newest frame
+        """
+        T = self.temporal
+        history = self.past["history"]
+
+        if history.size(2) == 2 * T:
+            k = self.past["index"]
+        else:
+            window = self.window()
+            history = torch.cat([window, window], dim=2)
+            k = T - 1
+
+        k = (k + 1) % T
+        history[:, :, k] = x
+        history[:, :, k + T] = x
+
+        self.past["history"] = history
+        self.past["index"] = k
+
+        return history[:, :, k + 1 : k + 1 + T]
+
     def weight(self, stream=None):
         """
         Parameters
@@ -257,7 +356,13 @@ class Conv(Module):
         stream : int | None
             specific stream (int) or all streams (None)
         """
-        if stream is None:
+        if self.folded_weight is not None:
+            if stream is None:
+                return self.folded_weight
+            else:
+                return self.folded_weight.chunk(self.streams, dim=0)[stream]
+
+        elif stream is None:
             weights = [self.weight(stream) for stream in range(self.streams)]
             return torch.cat(weights, dim=0)
 
@@ -274,56 +379,90 @@ class Conv(Module):
         else:
             return self.weights[stream]
 
+    def _bias(self, stream=None):
+        if not self.bias:
+            return None
+
+        elif self.folded_bias is not None:
+            if stream is None:
+                return self.folded_bias
+            else:
+                return self.folded_bias.chunk(self.streams, dim=0)[stream]
+
+        elif stream is None:
+            return torch.cat([_.flatten() for _ in self.biases])
+
+        else:
+            return self.biases[stream].flatten()
+
     def forward(self, x, stream=None):
         """
         Parameters
         ----------
-        x : 4D Tensor
-            [N, C, H, W] -- stream is int
+        x : 4D|5D Tensor
+            [N, C, H, W] | [N, C, T, H, W] (clip) -- stream is int
                 or
-            [N, S*C, H, W] -- stream is None
+            [N, S*C, H, W] | [N, S*C, T, H, W] (clip) -- stream is None
         stream : int | None
             specific stream (int) or all streams (None)
 
         Returns
         -------
         Tensor
-            [N, C', H, W] -- stream is int
+            [N, C', H, W] | [N, C', T, H, W] (clip) -- stream is int
                 or
-            [N, S*C', H, W] -- stream is None
+            [N, S*C', H, W] | [N, S*C', T, H, W] (clip) -- stream is None
         """
         x = self.pad_fn(x)
+        clip = x.ndim == 5
 
         if self.past:
             assert self.past["stream"] == stream
             weight = self.past["weight"]
+            bias = self.past["bias"]
             history = self.past["history"]
 
         else:
             self.past["stream"] = stream
             self.past["weight"] = weight = self.weight(stream)
+            self.past["bias"] = bias = self._bias(stream)
 
             if self.temporal > 1:
-                start = x if self.pad == "replicate" else torch.zeros_like(x)
-                self.past["history"] = history = deque([start] * self.temporal, maxlen=self.temporal)
+                start = x[:, :, 0] if clip else x
+                start = start if self.pad == "replicate" else torch.zeros_like(start)
+                self.past["history"] = history = start.unsqueeze(dim=2).expand(-1, -1, self.temporal, -1, -1)
+                self.past["index"] = -1
             else:
                 self.past["history"] = history = None
 
         if history is None:
-            x = x.unsqueeze(dim=2)
+            if not clip:
+                x = x.unsqueeze(dim=2)
+
+        elif clip:
+            x = torch.cat([self.window()[:, :, 1:], x], dim=2)
+            self.past["history"] = x[:, :, -self.temporal :]
+            self.past["index"] = -1
+
+        elif torch.is_grad_enabled() and (x.requires_grad or history.requires_grad or weight.requires_grad):
+            x = torch.cat([self.window()[:, :, 1:], x.unsqueeze(dim=2)], dim=2)
+            self.past["history"] = x
+            self.past["index"] = -1
+
         else:
-            history.append(x)
-            x = torch.stack(list(history), dim=2)
+            x = self.push(x)
 
         if stream is None:
             groups = self.in_groups * self.streams
-            bias = torch.cat([_.flatten() for _ in self.biases]) if self.bias else None
         else:
             groups = self.in_groups
-            bias = self.biases[stream].flatten() if self.bias else None
 
-        y = nn.functional.conv3d(input=x, weight=weight, bias=bias, groups=groups, stride=self.stride)
-        return y.squeeze(dim=2)
+        if clip:
+            stride = [1, self.stride, self.stride]
+            return nn.functional.conv3d(input=x, weight=weight, bias=bias, groups=groups, stride=stride)
+        else:
+            y = nn.functional.conv3d(input=x, weight=weight, bias=bias, groups=groups, stride=self.stride)
+            return y.squeeze(dim=2)
 
     def extra_repr(self):
         s = "{streams} x {inp}->{out}, gain={gain}, bias={bias}"
@@ -467,6 +606,8 @@ class InterGroup(Module):
         zero = torch.zeros([self.groups, self.groups, self.group_out, self.group_in])
         self.register_buffer("zero", zero)
 
+        self.register_buffer("folded_weight", None, persistent=False)
+
         if self.gain:
             gain = lambda: Parameter(torch.full([self.groups, self.group_out], self.init_gain))
             self.gains = ParameterList([gain() for _ in range(streams)])
@@ -478,6 +619,17 @@ class InterGroup(Module):
     def _reset(self):
         self.past.clear()
 
+    def _compile(self, mode=True):
+        self.folded_weight = None
+
+        if mode:
+            with torch.no_grad():
+                self.folded_weight = self.weight()
+
+    def _set_state(self, state, stream=None):
+        if self.past and self.past["stream"] != stream:
+            self.past.clear()
+
     def weight(self, stream=None):
         """
         Parameters
@@ -485,7 +637,13 @@ class InterGroup(Module):
         stream : int | None
             specific stream (int) or all streams (None)
         """
-        if stream is None:
+        if self.folded_weight is not None:
+            if stream is None:
+                return self.folded_weight
+            else:
+                return self.folded_weight.chunk(self.streams, dim=0)[stream]
+
+        elif stream is None:
             weights = [self.weight(stream) for stream in range(self.streams)]
             return torch.cat(weights, dim=0)
 
@@ -566,6 +724,185 @@ class Accumulate(ModuleList):
         return add([module(_, stream=stream) for module, _ in zip(self, x)])
 
 
+class Gates(ModuleList):
+    """Projections of the same input, fused into a single grouped convolution"""
+
+    def __init__(self, modules):
+        """
+        Parameters
+        ----------
+        modules : Sequence[fnn.model.elements.Conv]
+            projections (K) with identical channels, groups, streams, kernels, and biases
+        """
+        super().__init__(modules)
+
+        config = lambda m: [
+            m.in_channels,
+            m.out_channels,
+            m.in_groups,
+            m.streams,
+            m.temporal,
+            m.spatial,
+            m.stride,
+            m.pad,
+            m.bias,
+        ]
+        if not all(isinstance(m, Conv) for m in self):
+            raise ValueError("Gates must be Conv modules")
+
+        if not all(config(m) == config(self[0]) for m in self):
+            raise ValueError("Gates must have identical configurations")
+
+        if self[0].temporal != 1:
+            raise ValueError("Gates must not have a temporal kernel")
+
+        self.register_buffer("folded_weight", None, persistent=False)
+        self.register_buffer("folded_bias", None, persistent=False)
+
+        self.past = dict()
+
+    def _reset(self):
+        self.past.clear()
+
+    def _compile(self, mode=True):
+        self.folded_weight = None
+        self.folded_bias = None
+
+        if mode:
+            with torch.no_grad():
+                self.folded_weight = self.weight()
+                self.folded_bias = self._bias()
+
+            # the projections are only used through the fused weights
+            for module in self:
+                module._compile(False)
+
+    def _detach(self):
+        if self.past:
+            self.past["weight"] = self.weight(self.past["stream"])
+            self.past["bias"] = self._bias(self.past["stream"])
+
+    def _set_state(self, state, stream=None):
+        if self.past and self.past["stream"] != stream:
+            self.past.clear()
+
+    @staticmethod
+    def map_state_dict(state_dict, prefix, names):
+        """Maps the parameters of separate projections onto fused gates, in place
+
+        Parameters
+        ----------
+        state_dict : dict[str, Tensor]
+            module state dict
+        prefix : str
+            prefix of the fused gates
+        names : Sequence[str]
+            prefixes of the separate projections, in gate order
+        """
+        for i, name in enumerate(names):
+            for key in [key for key in state_dict if key.startswith(name)]:
+                state_dict[f"{prefix}{i}.{key[len(name):]}"] = state_dict.pop(key)
+
+    def weight(self, stream=None):
+        """
+        Parameters
+        ----------
+        stream : int | None
+            specific stream (int) or all streams (None)
+
+        Returns
+        -------
+        4D Tensor
+            [K*O, I/G, k, k] -- stream is int
+                or
+            [S*K*O, I/G, k, k] -- stream is None
+        """
+        if self.folded_weight is not None:
+            if stream is None:
+                return self.folded_weight
+            else:
+                return self.folded_weight.chunk(self[0].streams, dim=0)[stream]
+
+        elif stream is None:
+            weights = [self.weight(stream) for stream in range(self[0].streams)]
+            return torch.cat(weights, dim=0)
+
+        else:
+            weights = [m.weight(stream).squeeze(dim=2).unflatten(0, [m.in_groups, -1]) for m in self]
+            return torch.stack(weights, dim=1).flatten(0, 2)
+
+    def _bias(self, stream=None):
+        if not self[0].bias:
+            return None
+
+        elif self.folded_bias is not None:
+            if stream is None:
+                return self.folded_bias
+            else:
+                return self.folded_bias.chunk(self[0].streams, dim=0)[stream]
+
+        elif stream is None:
+            biases = [self._bias(stream) for stream in range(self[0].streams)]
+            return torch.cat(biases, dim=0)
+
+        else:
+            biases = [m._bias(stream).unflatten(0, [m.in_groups, -1]) for m in self]
+            return torch.stack(biases, dim=1).flatten()
+
+    def forward(self, x, stream=None):
+        """
+        Parameters
+        ----------
+        x : 2D|4D Tensor
+            [N, I] | [N, I, H, W] -- stream is int
+                or
+            [N, S*I] | [N, S*I, H, W] -- stream is None
+        stream : int | None
+            specific stream (int) or all streams (None)
+
+        Returns
+        -------
+        List[Tensor]
+            [[N, O] | [N, O, H, W], ...] -- stream is int
+                or
+            [[N, S*O] | [N, S*O, H, W], ...] -- stream is None
+        """
+        conv = self[0]
+
+        if self.past:
+            assert self.past["stream"] == stream
+            weight = self.past["weight"]
+            bias = self.past["bias"]
+        else:
+            self.past["stream"] = stream
+            self.past["weight"] = weight = self.weight(stream)
+            self.past["bias"] = bias = self._bias(stream)
+
+        if stream is None:
+            S = conv.streams
+        else:
+            S = 1
+
+        flat = x.ndim == 2
+        if flat:
+            x = x[:, :, None, None]
+
+        y = nn.functional.conv2d(
+            input=conv.pad_fn(x),
+            weight=weight,
+            bias=bias,
+            stride=conv.stride,
+            groups=conv.in_groups * S,
+        )
+        N, _, H, W = y.shape
+        y = y.view(N, S, conv.in_groups, len(self), -1, H, W).unbind(dim=3)
+
+        if flat:
+            return [_.reshape(N, -1) for _ in y]
+        else:
+            return [_.reshape(N, -1, H, W) for _ in y]
+
+
 class Lstm(Module):
     def __init__(
         self,
@@ -606,31 +943,22 @@ class Lstm(Module):
         self.drop_x = FlatDropout(p=self._dropout)
         self.drop_h = FlatDropout(p=self._dropout)
 
-        self.proj_i = Linear(
-            in_features=self.in_features + self.out_features,
-            out_features=self.out_features,
-            streams=self.streams,
-            wnorm=self.wnorm,
-            bias=float(init_input),
-        )
-        self.proj_f = Linear(
-            in_features=self.in_features + self.out_features,
-            out_features=self.out_features,
-            streams=self.streams,
-            wnorm=self.wnorm,
-            bias=float(init_forget),
-        )
-        self.proj_g = Linear(
-            in_features=self.in_features + self.out_features,
-            out_features=self.out_features,
-            streams=self.streams,
-            wnorm=self.wnorm,
-        )
-        self.proj_o = Linear(
-            in_features=self.in_features + self.out_features,
-            out_features=self.out_features,
-            streams=self.streams,
-            wnorm=self.wnorm,
+        def linear(bias):
+            return Linear(
+                in_features=self.in_features + self.out_features,
+                out_features=self.out_features,
+                streams=self.streams,
+                wnorm=self.wnorm,
+                bias=bias,
+            )
+
+        self.gates = Gates(
+            [
+                linear(bias=float(init_input)),
+                linear(bias=float(init_forget)),
+                linear(bias=0),
+                linear(bias=0),
+            ]
         )
         self.past = dict()
 
@@ -640,6 +968,20 @@ class Lstm(Module):
     def _reset(self):
         self.past.clear()
 
+    def _detach(self):
+        self.past = {k: v.detach() for k, v in self.past.items()}
+
+    def _get_state(self):
+        return dict(self.past)
+
+    def _set_state(self, state, stream=None):
+        self.past = dict(state)
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        names = [f"{prefix}proj_{gate}." for gate in "ifgo"]
+        Gates.map_state_dict(state_dict, f"{prefix}gates.", names)
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
     def forward(self, x, stream=None):
         """
         Parameters
@@ -672,10 +1014,11 @@ class Lstm(Module):
         x = self.drop_x(x)
         xh = cat_groups([x, h], groups=S, expand=True)
 
-        i = torch.sigmoid(self.proj_i(xh, stream=stream))
-        f = torch.sigmoid(self.proj_f(xh, stream=stream))
-        g = torch.tanh(self.proj_g(xh, stream=stream))
-        o = torch.sigmoid(self.proj_o(xh, stream=stream))
+        i, f, g, o = self.gates(xh, stream=stream)
+        i = torch.sigmoid(i)
+        f = torch.sigmoid(f)
+        g = torch.tanh(g)
+        o = torch.sigmoid(o)
 
         c = f * c + i * g
         h = o * torch.tanh(c)
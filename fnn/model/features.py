@@ -24,19 +24,21 @@ class Feature(Module):
         """
         raise NotImplementedError()
 
-    def forward(self, stream=None):
+    def forward(self, stream=None, unit_index=None):
         """
         Parameters
         ----------
         stream : int | None
             specific stream (int) or all streams (None)
+        unit_index : 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         Tensor
-            [U, O, I] -- stream is int
+            [U', O, I] -- stream is int
                 or
-            [S, U, O, I] -- stream is None
+            [S, U', O, I] -- stream is None
         """
         raise NotImplementedError()
 
@@ -61,6 +63,8 @@ class Norm(Feature):
         self.groups = int(groups)
         self.eps = float(eps)
 
+        self.register_buffer("folded_weight", None, persistent=False)
+
         self.past = dict()
 
     def _init(self, inputs, outputs, units, streams):
@@ -99,55 +103,80 @@ class Norm(Feature):
     def _reset(self):
         self.past.clear()
 
-    def weight(self, stream):
+    def _compile(self, mode=True):
+        self.folded_weight = None
+
+        if mode:
+            with torch.no_grad():
+                self.folded_weight = self.weight(None)
+
+    def _set_state(self, state, stream=None):
+        if self.past and self.past["stream"] != stream:
+            self.past.clear()
+
+    def weight(self, stream, unit_index=None):
         """
         Parameters
         ----------
-        stream : int
-            stream index
+        stream : int | None
+            specific stream (int) or all streams (None)
+        unit_index : 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         Tensor
-            [U, O, I]
+            [U', O, I] -- stream is int
+                or
+            [S, U', O, I] -- stream is None
         """
-        if stream is None:
-            weights = [self.weight(stream=s) for s in range(self.streams)]
+        if self.folded_weight is not None:
+            weight = self.folded_weight if stream is None else self.folded_weight[stream]
+            return weight if unit_index is None else weight[..., unit_index, :, :]
+
+        elif stream is None:
+            weights = [self.weight(stream=s, unit_index=unit_index) for s in range(self.streams)]
             return torch.stack(weights, dim=0)
 
         else:
             weight = self.weights[stream]
             gain = self.gains[stream]
 
+            if unit_index is not None:
+                weight = weight[unit_index]
+                gain = gain[unit_index]
+
             var, mean = torch.var_mean(weight, dim=3, unbiased=False, keepdim=True)
             scale = (var * self.inputs + self.eps).pow(-0.5)
 
             weight = (weight - mean) * scale
             return torch.einsum("U O G I, U O G -> U O G I", weight, gain).flatten(start_dim=2)
 
-    def forward(self, stream=None):
+    def forward(self, stream=None, unit_index=None):
         """
         Parameters
         ----------
         stream : int | None
             specific stream (int) or all streams (None)
+        unit_index : 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         Tensor
-            [U, O, I] -- stream is int
+            [U', O, I] -- stream is int
                 or
-            [S, U, O, I] -- stream is None
+            [S, U', O, I] -- stream is None
         """
         if self.past:
             assert self.past["stream"] == stream
-            weight = self.past["weight"]
 
-        else:
+        if not self.past or self.past["unit_index"] is not unit_index:
             self.past["stream"] = stream
-            self.past["weight"] = weight = self.weight(stream)
+            self.past["unit_index"] = unit_index
+            self.past["weight"] = self.weight(stream, unit_index)
 
-        return weight
+        return self.past["weight"]
 
 
 class Vanilla(Feature):
@@ -176,22 +205,25 @@ class Vanilla(Feature):
         self.weights.scale = self.units
         self.weights.norm_dim = 2
 
-    def forward(self, stream=None):
+    def forward(self, stream=None, unit_index=None):
         """
         Parameters
         ----------
         stream : int | None
             specific stream (int) or all streams (None)
+        unit_index : 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         Tensor
-            [U, O, I] -- stream is int
+            [U', O, I] -- stream is int
                 or
-            [S, U, O, I] -- stream is None
+            [S, U', O, I] -- stream is None
         """
         if stream is None:
-            return torch.stack(list(self.weights), dim=0)
-
+            weight = torch.stack(list(self.weights), dim=0)
         else:
-            return self.weights[stream]
+            weight = self.weights[stream]
+
+        return weight if unit_index is None else weight[..., unit_index, :, :]
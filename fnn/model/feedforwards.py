@@ -36,18 +36,18 @@ class Feedforward(Module):
         Parameters
         ----------
         inputs : Sequence[Tensor]
-            [[N, I, H, W] ...] -- stream is int
+            [[N, I, H, W] ...] | [[N, I, T, H, W] ...] (clip) -- stream is int
                 or
-            [[N, S*I, H, W] ...] -- stream is None
+            [[N, S*I, H, W] ...] | [[N, S*I, T, H, W] ...] (clip) -- stream is None
         stream : int | None
             specific stream (int) or all streams (None)
 
         Returns
         -------
         Tensor
-            [N, O, H//D, W//D] -- stream is int
+            [N, O, H//D, W//D] | [N, O, T, H//D, W//D] (clip) -- stream is int
                 or
-            [N, S*O, H//D, W//D] -- stream is None
+            [N, S*O, H//D, W//D] | [N, S*O, T, H//D, W//D] (clip) -- stream is None
         """
         raise NotImplementedError()
 
@@ -132,7 +132,11 @@ class Block(Module):
         if self.pool == 1:
             self.pool_fn = lambda x: x
         else:
-            self.pool_fn = lambda x: torch.nn.functional.avg_pool2d(x, self.pool)
+            self.pool_fn = lambda x: (
+                torch.nn.functional.avg_pool2d(x, self.pool)
+                if x.ndim == 4
+                else torch.nn.functional.avg_pool3d(x, [1, self.pool, self.pool])
+            )
 
     def _restart(self):
         self.dropout(p=self._dropout)
@@ -141,19 +145,19 @@ class Block(Module):
         """
         Parameters
         ----------
-        x : 4D Tensor
-            [N, C, H, W] -- stream is int
+        x : 4D|5D Tensor
+            [N, C, H, W] | [N, C, T, H, W] (clip) -- stream is int
                 or
-            [N, S*C, H, W] -- stream is None
+            [N, S*C, H, W] | [N, S*C, T, H, W] (clip) -- stream is None
         stream : int | None
             specific stream (int) or all streams (None)
 
         Returns
         -------
-        4D Tensor
-            [N, C, H', W'] -- stream is int
+        4D|5D Tensor
+            [N, C, H', W'] | [N, C, T, H', W'] (clip) -- stream is int
                 or
-            [N, S*C, H', W'] -- stream is None
+            [N, S*C, H', W'] | [N, S*C, T, H', W'] (clip) -- stream is None
         """
         if stream is None:
             groups = self.groups * self.streams
@@ -330,18 +334,18 @@ class Dense(Feedforward):
         Parameters
         ----------
         x : Sequence[Tensor]
-            [[N, I, H, W] ...] -- stream is int
+            [[N, I, H, W] ...] | [[N, I, T, H, W] ...] (clip) -- stream is int
                 or
-            [[N, S*I, H, W] ...] -- stream is None
+            [[N, S*I, H, W] ...] | [[N, S*I, T, H, W] ...] (clip) -- stream is None
         stream : int | None
             specific stream (int) or all streams (None)
 
         Returns
         -------
         Tensor
-            [N, O, H', W'] -- stream is int
+            [N, O, H', W'] | [N, O, T, H', W'] (clip) -- stream is int
                 or
-            [N, S*O, H', W'] -- stream is None
+            [N, S*O, H', W'] | [N, S*O, T, H', W'] (clip) -- stream is None
         """
         if stream is None:
             x = cat_groups_2d(x, groups=self.streams)
@@ -512,18 +516,18 @@ class InputDense(Feedforward):
         Parameters
         ----------
         x : Sequence[Tensor]
-            [[N, I, H, W] ...] -- stream is int
+            [[N, I, H, W] ...] | [[N, I, T, H, W] ...] (clip) -- stream is int
                 or
-            [[N, S*I, H, W] ...] -- stream is None
+            [[N, S*I, H, W] ...] | [[N, S*I, T, H, W] ...] (clip) -- stream is None
         stream : int | None
             specific stream (int) or all streams (None)
 
         Returns
         -------
         Tensor
-            [N, O, H', W'] -- stream is int
+            [N, O, H', W'] | [N, O, T, H', W'] (clip) -- stream is int
                 or
-            [N, S*O, H', W'] -- stream is None
+            [N, S*O, H', W'] | [N, S*O, T, H', W'] (clip) -- stream is None
         """
         if stream is None:
             x = cat_groups_2d(x, groups=self.streams)
@@ -1,7 +1,7 @@
 import torch
 from torch.nn import init
 from .modules import Module
-from .elements import Linear, FlatDropout, Mlp, Lstm
+from .elements import Linear, Gates, FlatDropout, Mlp, Lstm
 from .parameters import Parameter, ParameterList
 from .utils import cat_groups
 
@@ -117,10 +117,14 @@ class FlatLstm(Modulation):
                 bias=bias,
             )
 
-        self.proj_i = linear(bias=self.init_input)
-        self.proj_f = linear(bias=self.init_forget)
-        self.proj_g = linear(bias=0)
-        self.proj_o = linear(bias=0)
+        self.gates = Gates(
+            [
+                linear(bias=self.init_input),
+                linear(bias=self.init_forget),
+                linear(bias=0),
+                linear(bias=0),
+            ]
+        )
 
         self.out = Linear(
             in_features=self.hidden_features,
@@ -136,6 +140,20 @@ class FlatLstm(Modulation):
     def _reset(self):
         self.past.clear()
 
+    def _detach(self):
+        self.past = {k: v.detach() for k, v in self.past.items()}
+
+    def _get_state(self):
+        return dict(self.past)
+
+    def _set_state(self, state, stream=None):
+        self.past = dict(state)
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        names = [f"{prefix}proj_{gate}." for gate in "ifgo"]
+        Gates.map_state_dict(state_dict, f"{prefix}gates.", names)
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
     @property
     def features(self):
         """
@@ -180,10 +198,11 @@ class FlatLstm(Modulation):
 
         xh = cat_groups([x, h], groups=S, expand=True)
 
-        i = torch.sigmoid(self.proj_i(xh, stream=stream))
-        f = torch.sigmoid(self.proj_f(xh, stream=stream))
-        g = torch.tanh(self.proj_g(xh, stream=stream))
-        o = torch.sigmoid(self.proj_o(xh, stream=stream))
+        i, f, g, o = self.gates(xh, stream=stream)
+        i = torch.sigmoid(i)
+        f = torch.sigmoid(f)
+        g = torch.tanh(g)
+        o = torch.sigmoid(o)
 
         c = f * c + i * g
         h = o * torch.tanh(c)
@@ -226,6 +245,10 @@ class Sigmoid(Module):
     def _reset(self):
         self.past.clear()
 
+    def _set_state(self, state, stream=None):
+        if self.past and self.past["stream"] != stream:
+            self.past.clear()
+
     def gain(self, stream=None):
         """
         Parameters
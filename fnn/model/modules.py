@@ -1,5 +1,6 @@
 import numpy as np
 from itertools import chain
+from collections import defaultdict
 from contextlib import contextmanager
 from torch import nn, inference_mode
 
@@ -31,10 +32,22 @@ class Module(nn.Module):
     def _restart(self):
         return
 
+    def _detach(self):
+        self._reset()
+
+    def _compile(self, mode=True):
+        return
+
     def _regularize(self):
         return
         yield
 
+    def _get_state(self):
+        return dict()
+
+    def _set_state(self, state, stream=None):
+        return
+
     def reset(self):
         def fn(module):
             module._reset()
@@ -49,12 +62,77 @@ class Module(nn.Module):
         all(self._iterate(fn))
         return self
 
+    def detach(self):
+        def fn(module):
+            module._detach()
+
+        all(self._iterate(fn))
+        return self
+
     def regularize(self):
         def fn(module):
             yield from module._regularize()
 
         return list(self._iterate(fn))
 
+    def compile_for_inference(self, mode=True):
+        """Folds weight normalization, gains, and stream concatenation into fixed weights and freezes the module
+
+        Parameters
+        ----------
+        mode : bool
+            fold and freeze (True) or restore the weights computed from the parameters and unfreeze (False)
+        """
+        def fn(module):
+            module._compile(mode)
+
+        self.reset()
+        all(self._iterate(fn))
+
+        return self.freeze(mode)
+
+    def snapshot(self):
+        """Snapshot of the recurrent state held by the module and its submodules
+
+        The state lives in the modules, which are updated in place by forward. A snapshot can be restored later,
+        and snapshots of independent sessions can be concatenated along the batch dimension.
+
+        Returns
+        -------
+        dict[str, Tensor]
+            recurrent state of the module and its submodules, keyed by "{module name}.{state name}"
+        """
+        state = dict()
+
+        for name, module in self.named_modules():
+            if isinstance(module, Module):
+                for key, val in module._get_state().items():
+                    state[f"{name}.{key}" if name else key] = val
+
+        return state
+
+    def restore(self, state, stream=None):
+        """Restores the recurrent state of the module and its submodules from a snapshot
+
+        Parameters
+        ----------
+        state : dict[str, Tensor]
+            recurrent state, as returned by snapshot
+        stream : int | None
+            specific stream (int) or all streams (None)
+        """
+        states = defaultdict(dict)
+
+        for key, val in state.items():
+            name, _, key = key.rpartition(".")
+            states[name][key] = val
+
+        for name, module in self.named_modules():
+            if isinstance(module, Module):
+                module._set_state(states[name], stream=stream)
+
+        return self
+
     def dropout(self, p=0):
         from .elements import Dropout
 
@@ -172,3 +250,9 @@ class ModuleList(nn.ModuleList, Module):
     """Module List"""
 
     pass
+
+
+class ModuleDict(nn.ModuleDict, Module):
+    """Module Dict"""
+
+    pass
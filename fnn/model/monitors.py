@@ -122,6 +122,16 @@ class Plane(Monitor):
         self._position.clear()
         self._rays = None
 
+    def _get_state(self):
+        if self.training:
+            return dict(self._position)
+        else:
+            return dict()
+
+    def _set_state(self, state, stream=None):
+        self._position = dict(state)
+        self._rays = None
+
     def position(self, batch_size=1):
         """
         Parameters
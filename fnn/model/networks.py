@@ -1,7 +1,9 @@
 import torch
 import numpy as np
 from itertools import repeat
-from .modules import Module
+from collections.abc import Mapping
+from .modules import Module, ModuleDict
+from .utils import to_device
 
 
 # -------------- Network Base --------------
@@ -47,7 +49,7 @@ class Network(Module):
         """
         raise NotImplementedError()
 
-    def forward(self, stimulus, perspective, modulation, stream=None):
+    def forward(self, stimulus, perspective, modulation, stream=None, unit_index=None):
         """
         Parameters
         ----------
@@ -59,15 +61,17 @@ class Network(Module):
             [N, M] -- modulation frame
         stream : int | None
             specific stream (int) or all streams (None)
+        unit_index : int | Sequence[int] | 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         2D Tensor
-            [N, U] -- response frame
+            [N, U'] -- response frame
         """
         raise NotImplementedError()
 
-    def loss(self, stimulus, perspective, modulation, unit, stream=None):
+    def loss(self, stimulus, perspective, modulation, unit, stream=None, unit_index=None):
         """
         Parameters
         ----------
@@ -78,14 +82,16 @@ class Network(Module):
         modulation : 2D Tensor
             [N, M] -- modulation frame
         unit : 2D Tensor
-            [N, U] --  unit frame
+            [N, U'] --  unit frame
         stream : int | None
             specific stream (int) or all streams (None)
+        unit_index : int | Sequence[int] | 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         Tensor
-            [N, U] -- loss frame
+            [N, U'] -- loss frame
         """
         raise NotImplementedError()
 
@@ -96,6 +102,7 @@ class Network(Module):
         modulations=None,
         training=False,
         reset=True,
+        clip=False,
     ):
         """
         Parameters
@@ -110,6 +117,8 @@ class Network(Module):
             training or inference mode
         reset : bool
             reset or continue state
+        clip : bool
+            run the feedforward core over all frames at once or frame by frame
 
         Yields
         ------
@@ -133,6 +142,7 @@ class Network(Module):
         stream=None,
         training=False,
         reset=True,
+        clip=False,
     ):
         """
         Parameters
@@ -151,6 +161,8 @@ class Network(Module):
             training or inference mode
         reset : bool
             reset or continue state
+        clip : bool
+            run the feedforward core over all frames at once or frame by frame
 
         Yields
         ------
@@ -262,7 +274,7 @@ class Visual(Network):
         """
         return np.zeros([self.modulations])
 
-    def _raw(self, stimulus, perspective, modulation, stream=None, periphery="dark"):
+    def _inputs(self, stimulus, perspective, modulation, stream=None, periphery="dark"):
         """
         Parameters
         ----------
@@ -279,47 +291,228 @@ class Visual(Network):
 
         Returns
         -------
-        3D Tensor
-            [N, U, R] -- raw output
+        4D Tensor
+            [N, S*P', H', W'] -- stream is None
+                or
+            [N, P', H', W'] -- stream is int
+        2D Tensor
+            [N, S*M'] -- stream is None
+                or
+            [N, M'] -- stream is int
+        """
+        perspective = self._perspective(
+            stimulus=stimulus,
+            perspective=perspective,
+            stream=stream,
+            periphery=periphery,
+        )
+        modulation = self._modulation(
+            modulation=modulation,
+            stream=stream,
+        )
+        return perspective, modulation
+
+    @staticmethod
+    def _pad_mode(periphery):
+        """
+        Parameters
+        ----------
+        periphery : str
+            "dark" | "extend"
+
+        Returns
+        -------
+        str
+            "zeros" | "replicate" -- stimulus pad mode
         """
         if periphery == "dark":
-            perspective = self.perspective(
-                stimulus=stimulus,
-                perspective=perspective,
-                pad_mode="zeros",
-            )
+            return "zeros"
         elif periphery == "extend":
-            perspective = self.perspective(
-                stimulus=stimulus,
-                perspective=perspective,
-                pad_mode="replicate",
-            )
+            return "replicate"
         else:
             raise ValueError(f"Invalid periphery -- {periphery}")
 
+    def _perspective(self, stimulus, perspective, stream=None, periphery="dark"):
+        """
+        Parameters
+        ----------
+        stimulus : 4D|5D Tensor
+            [N, C, H, W] -- stimulus frame
+                or
+            [N, C, T, H, W] -- stimulus clip (fixed perspective grid)
+        perspective : 2D Tensor
+            [N, P] -- perspective frame
+        stream : int | None
+            specific stream (int) or all streams (None)
+        periphery : str
+            "dark" | "extend"
+
+        Returns
+        -------
+        4D|5D Tensor
+            [N, S*P', (T,) H', W'] -- stream is None
+                or
+            [N, P', (T,) H', W'] -- stream is int
+        """
+        perspective = self.perspective(
+            stimulus=stimulus,
+            perspective=perspective,
+            pad_mode=self._pad_mode(periphery),
+        )
+
+        if stream is None:
+            perspective = perspective.repeat(1, self.streams, *[1] * (perspective.ndim - 2))
+
+        return perspective
+
+    def _modulation(self, modulation, stream=None):
+        """
+        Parameters
+        ----------
+        modulations : 2D Tensor
+            [N, M] -- modulation frame
+        stream : int | None
+            specific stream (int) or all streams (None)
+
+        Returns
+        -------
+        2D Tensor
+            [N, S*M'] -- stream is None
+                or
+            [N, M'] -- stream is int
+        """
         if stream is None:
-            perspective = perspective.repeat(1, self.streams, 1, 1)
             modulation = modulation.repeat(1, self.streams)
 
-        modulation = self.modulation(
-            modulation=modulation,
-            stream=stream,
-        )
-        core = self.core(
-            perspective=perspective,
+        return self.modulation(
             modulation=modulation,
             stream=stream,
         )
+
+    def _outputs(self, core, stream=None, unit_index=None):
+        """
+        Parameters
+        ----------
+        core : 4D Tensor
+            [N, S*C, H', W'] -- stream is None
+                or
+            [N, C, H', W'] -- stream is int
+        stream : int | None
+            specific stream (int) or all streams (None)
+        unit_index : int | Sequence[int] | 1D Tensor | None
+            subset of units (U') or all units (None)
+
+        Returns
+        -------
+        3D Tensor
+            [N, U', R] -- raw output
+        """
         readout = self.readout(
             core=core,
             stream=stream,
+            unit_index=unit_index,
         )
         if stream is None:
             return self.reduce(readout)
         else:
             return readout
 
-    def forward(self, stimulus, perspective, modulation, stream=None, periphery="dark"):
+    def _raw(self, stimulus, perspective, modulation, stream=None, periphery="dark", unit_index=None):
+        """
+        Parameters
+        ----------
+        stimulus : 4D Tensor
+            [N, C, H, W] -- stimulus frame
+        perspective : 2D Tensor
+            [N, P] -- perspective frame
+        modulations : 2D Tensor
+            [N, M] -- modulation frame
+        stream : int | None
+            specific stream (int) or all streams (None)
+        periphery : str
+            "dark" | "extend"
+        unit_index : int | Sequence[int] | 1D Tensor | None
+            subset of units (U') or all units (None)
+
+        Returns
+        -------
+        3D Tensor
+            [N, U', R] -- raw output
+        """
+        perspective, modulation = self._inputs(
+            stimulus=stimulus,
+            perspective=perspective,
+            modulation=modulation,
+            stream=stream,
+            periphery=periphery,
+        )
+        core = self.core(
+            perspective=perspective,
+            modulation=modulation,
+            stream=stream,
+        )
+        return self._outputs(core=core, stream=stream, unit_index=unit_index)
+
+    def _raw_clip(self, stimuli, perspectives, modulations, stream=None, periphery="dark", unit_index=None):
+        """
+        Parameters
+        ----------
+        stimuli : Sequence[4D Tensor]
+            T x [N, C, H, W] -- stimulus frames
+        perspectives : Sequence[2D Tensor]
+            T x [N, P] -- perspective frames
+        modulations : Sequence[2D Tensor]
+            T x [N, M] -- modulation frames
+        stream : int | None
+            specific stream (int) or all streams (None)
+        periphery : str
+            "dark" | "extend"
+        unit_index : int | Sequence[int] | 1D Tensor | None
+            subset of units (U') or all units (None)
+
+        Returns
+        -------
+        List[3D Tensor]
+            T x [N, U', R] -- raw output, the feedforward core is applied to the whole clip at once
+
+        Notes
+        -----
+        With a fixed perspective grid (fnn.model.perspectives.Perspective.fix_grid) that matches the stimulus size
+        and periphery, the stimulus frames of the clip are resampled onto the retina in one sparse matrix
+        multiplication.
+        """
+        size = tuple(stimuli[0].shape[-2:])
+
+        if self.perspective.matches(size, self._pad_mode(periphery)):
+            perspective = self._perspective(
+                stimulus=torch.stack(list(stimuli), dim=2),
+                perspective=perspectives[0],
+                stream=stream,
+                periphery=periphery,
+            )
+        else:
+            perspective = torch.stack(
+                [
+                    self._perspective(
+                        stimulus=stimulus,
+                        perspective=perspective,
+                        stream=stream,
+                        periphery=periphery,
+                    )
+                    for stimulus, perspective in zip(stimuli, perspectives)
+                ],
+                dim=2,
+            )
+        modulation = torch.stack([self._modulation(modulation=m, stream=stream) for m in modulations], dim=2)
+
+        core = self.core(
+            perspective=perspective,
+            modulation=modulation,
+            stream=stream,
+        )
+        return [self._outputs(core=c, stream=stream, unit_index=unit_index) for c in core.unbind(2)]
+
+    def forward(self, stimulus, perspective, modulation, stream=None, periphery="dark", unit_index=None):
         """
         Parameters
         ----------
@@ -333,11 +526,13 @@ class Visual(Network):
             specific stream (int) or all streams (None)
         periphery : str
             "dark" | "extend"
+        unit_index : int | Sequence[int] | 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         2D Tensor
-            [N, U] -- response frame
+            [N, U'] -- response frame
         """
         r = self._raw(
             stimulus=stimulus,
@@ -345,10 +540,11 @@ class Visual(Network):
             modulation=modulation,
             stream=stream,
             periphery=periphery,
+            unit_index=unit_index,
         )
         return self.unit(readout=r)
 
-    def loss(self, stimulus, perspective, modulation, unit, stream=None):
+    def loss(self, stimulus, perspective, modulation, unit, stream=None, unit_index=None):
         """
         Parameters
         ----------
@@ -359,32 +555,76 @@ class Visual(Network):
         modulations : 2D Tensor
             [N, M] -- modulation frame
         unit : 2D Tensor
-            [N, U] --  unit frame
+            [N, U'] --  unit frame
         stream : int | None
             specific stream (int) or all streams (None)
+        unit_index : int | Sequence[int] | 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         2D Tensor
-            [N, U] -- loss frame
+            [N, U'] -- loss frame
         """
         r = self._raw(
             stimulus=stimulus,
             perspective=perspective,
             modulation=modulation,
             stream=stream,
+            unit_index=unit_index,
         )
         return self.unit.loss(readout=r, unit=unit)
 
+    def init_snapshot(self, batch_size=1, stream=None):
+        """Snapshot of the initial recurrent state, to be restored before the first frame of a session
+
+        Parameters
+        ----------
+        batch_size : int
+            batch size (N)
+        stream : int | None
+            specific stream (int) or all streams (None)
+
+        Returns
+        -------
+        dict[str, Tensor]
+            initial recurrent state -- {name: [N, ...]}
+
+        Notes
+        -----
+        The temporal history of replicate padded convolutions depends on the first stimulus frame. It is left out
+        of the initial snapshot and initialized from the first frame by forward.
+        """
+        from .elements import Conv
+
+        omit = {
+            f"{name}.history"
+            for name, module in self.named_modules()
+            if isinstance(module, Conv) and module.temporal > 1 and module.pad == "replicate"
+        }
+
+        # state shapes do not depend on the stimulus size, which is resampled by the perspective
+        stimulus = torch.zeros([batch_size, self.stimuli, 2, 2], device=self.device)
+        perspective = torch.zeros([batch_size, self.perspectives], device=self.device)
+        modulation = torch.zeros([batch_size, self.modulations], device=self.device)
+
+        self.reset()
+        with self.train_context(False):
+            self._raw(stimulus, perspective, modulation, stream=stream)
+            shapes = {k: (v.shape, v.dtype) for k, v in self.snapshot().items() if k not in omit}
+        self.reset()
+
+        return {k: torch.zeros(shape, dtype=dtype, device=self.device) for k, (shape, dtype) in shapes.items()}
+
     def to_tensor(self, stimulus, perspective=None, modulation=None):
         """
         Parameters
         ----------
-        stimulus : 2D|3D|4D array
-            [H, W] | [H, W, C] | [N, H, W, C]
-        perspective : 1D|2D array | None
+        stimulus : 2D|3D|4D array | 4D Tensor
+            [H, W] | [H, W, C] | [N, H, W, C] | [N, C, H, W] (Tensor)
+        perspective : 1D|2D array | 2D Tensor | None
             [P] | [N, P]
-        modulations : 1D|2D array | None
+        modulations : 1D|2D array | 2D Tensor | None
             [M] | [N, M]
 
         Returns
@@ -398,6 +638,26 @@ class Visual(Network):
         bool
             squeeze response batch dim
         """
+        if isinstance(stimulus, torch.Tensor):
+            assert stimulus.dtype == torch.uint8
+
+            device = self.device
+            tensor = lambda x: torch.as_tensor(x, dtype=torch.float, device=device)
+
+            stimulus = tensor(stimulus).div_(255)
+            N = stimulus.shape[0]
+
+            if perspective is None:
+                perspective = self.default_perspective[None]
+
+            if modulation is None:
+                modulation = self.default_modulation[None]
+
+            perspective = tensor(perspective).expand(N, -1)
+            modulation = tensor(modulation).expand(N, -1)
+
+            return stimulus, perspective, modulation, False
+
         assert stimulus.dtype == np.uint8
         stimulus = stimulus / 255
 
@@ -446,20 +706,25 @@ class Visual(Network):
         modulations=None,
         training=False,
         reset=True,
+        clip=False,
     ):
         """
         Parameters
         ----------
-        stimuli : Iterable[2D|3D|4D array]
-            T x [H, W] (singular) | T x [H, W, C] (singular) | T x [N, H, W, C] (batch) --- dtype=uint8
-        perspectives : Iterable[1D|2D array] | None
-            T x [P] (singular) | T x [N, P] (batch) --- dtype=float
-        modulations : Iterable[1D|2D array] | None
-            T x [M] (singular) | T x [N, M] (batch) --- dtype=float
+        stimuli : Iterable[2D|3D|4D array] | 5D Tensor
+            T x [H, W] (singular) | T x [H, W, C] (singular) | T x [N, H, W, C] (batch)
+            | [T, N, C, H, W] (batch Tensor) --- dtype=uint8
+        perspectives : Iterable[1D|2D array] | 3D Tensor | None
+            T x [P] (singular) | T x [N, P] (batch) | [T, N, P] (batch Tensor) --- dtype=float
+        modulations : Iterable[1D|2D array] | 3D Tensor | None
+            T x [M] (singular) | T x [N, M] (batch) | [T, N, M] (batch Tensor) --- dtype=float
         training : bool
             training or inference mode
         reset : bool
             reset or continue state
+        clip : bool
+            run the feedforward core over all frames at once (responses are yielded after the last input frame)
+            or frame by frame
 
         Yields
         ------
@@ -483,13 +748,22 @@ class Visual(Network):
 
         with self.train_context(training):
 
-            for stimulus, perspective, modulation in zip(
-                stimuli, perspectives, modulations
-            ):
+            device = self.device
+            stimuli, perspectives, modulations = (
+                to_device(x, device) for x in [stimuli, perspectives, modulations]
+            )
+
+            frames = (self.to_tensor(*inputs) for inputs in zip(stimuli, perspectives, modulations))
+
+            if clip:
+                frames = list(frames)
+                raws = self._raw_clip(*zip(*[tensors for *tensors, _ in frames]))
+                responses = ((self.unit(readout=r), squeeze) for r, (*_, squeeze) in zip(raws, frames))
+            else:
+                responses = ((self(*tensors), squeeze) for *tensors, squeeze in frames)
 
-                *tensors, squeeze = self.to_tensor(stimulus, perspective, modulation)
+            for response, squeeze in responses:
 
-                response = self(*tensors)
                 if squeeze:
                     response = response.squeeze(0)
 
@@ -507,12 +781,13 @@ class Visual(Network):
         stream=None,
         training=False,
         reset=True,
+        clip=False,
     ):
         """
         Parameters
         ----------
-        units : Iterable[1D|2D array]
-            T x [U] (singular) | T x [N, U] (batch) -- dtype=float
+        units : Iterable[1D|2D array] | 3D Tensor
+            T x [U] (singular) | T x [N, U] (batch) | [T, N, U] (batch Tensor) -- dtype=float
         stimuli : Iterable[2D|3D|4D array]
             T x [H, W] (singular) | T x [H, W, C] (singular) | T x [N, H, W, C] (batch) --- dtype=uint8
         perspectives : Iterable[1D|2D array] | None
@@ -525,6 +800,9 @@ class Visual(Network):
             training or inference mode
         reset : bool
             reset or continue state
+        clip : bool
+            run the feedforward core over all frames at once (losses are yielded after the last input frame)
+            or frame by frame
 
         Yields
         ------
@@ -549,22 +827,39 @@ class Visual(Network):
         with self.train_context(training):
 
             device = self.device
+            units, stimuli, perspectives, modulations = (
+                to_device(x, device) for x in [units, stimuli, perspectives, modulations]
+            )
 
-            for unit, stimulus, perspective, modulation in zip(
-                units, stimuli, perspectives, modulations
-            ):
+            def frames():
+                for unit, stimulus, perspective, modulation in zip(
+                    units, stimuli, perspectives, modulations
+                ):
 
-                unit = torch.tensor(unit, dtype=torch.float, device=device)
-                if unit.ndim == 1:
-                    unit = unit[None]
-                    squeeze = True
-                else:
-                    squeeze = False
+                    if isinstance(unit, torch.Tensor):
+                        unit = unit.float()
+                    else:
+                        unit = torch.tensor(unit, dtype=torch.float, device=device)
+                    if unit.ndim == 1:
+                        unit = unit[None]
+                        squeeze = True
+                    else:
+                        squeeze = False
+
+                    *tensors, _squeeze = self.to_tensor(stimulus, perspective, modulation)
+                    assert squeeze == _squeeze
+
+                    yield unit, tensors, squeeze
+
+            if clip:
+                _frames = list(frames())
+                raws = self._raw_clip(*zip(*[tensors for _, tensors, _ in _frames]), stream=stream)
+                losses = ((self.unit.loss(readout=r, unit=u), s) for r, (u, _, s) in zip(raws, _frames))
+            else:
+                losses = ((self.loss(*tensors, unit=unit, stream=stream), s) for unit, tensors, s in frames())
 
-                *tensors, _squeeze = self.to_tensor(stimulus, perspective, modulation)
-                assert squeeze == _squeeze
+            for loss, squeeze in losses:
 
-                loss = self.loss(*tensors, unit=unit, stream=stream)
                 if squeeze:
                     loss = loss.squeeze(0)
 
@@ -573,25 +868,177 @@ class Visual(Network):
                 else:
                     yield loss.cpu().numpy()
 
-    def predict(self, stimuli, perspectives=None, modulations=None):
+    def predict(self, stimuli, perspectives=None, modulations=None, clip=False):
         """
         Parameters
         ----------
-        stimuli : Iterable[2D|3D|4D array]
-            T x [H, W] (singular) | T x [H, W, C] (singular) | T x [N, H, W, C] (batch) --- dtype=uint8
-        perspectives : Iterable[1D|2D array] | None
-            T x [P] (singular) | T x [N, P] (batch) --- dtype=float
-        modulations : Iterable[1D|2D array] | None
-            T x [M] (singular) | T x [N, M] (batch) --- dtype=float
+        stimuli : Iterable[2D|3D|4D array] | 5D Tensor
+            T x [H, W] (singular) | T x [H, W, C] (singular) | T x [N, H, W, C] (batch)
+            | [T, N, C, H, W] (batch Tensor) --- dtype=uint8
+        perspectives : Iterable[1D|2D array] | 3D Tensor | None
+            T x [P] (singular) | T x [N, P] (batch) | [T, N, P] (batch Tensor) --- dtype=float
+        modulations : Iterable[1D|2D array] | 3D Tensor | None
+            T x [M] (singular) | T x [N, M] (batch) | [T, N, M] (batch Tensor) --- dtype=float
         training : bool
             training or inference mode
         reset : bool
             reset or continue state
+        clip : bool
+            run the feedforward core over all frames at once or frame by frame
 
         Returns
         -------
         2D array | 3D array
             [T, U] (singular input) | [T, N, U] (batch input) -- dtype=float
         """
-        response = self.generate_response(stimuli, perspectives, modulations)
+        response = self.generate_response(stimuli, perspectives, modulations, clip=clip)
         return np.array([*response])
+
+
+class MultiVisual(Module):
+    """Visual Networks with a Shared Core"""
+
+    def __init__(self, networks):
+        """
+        Parameters
+        ----------
+        networks : Mapping[str, fnn.model.networks.Visual]
+            visual networks that share the same core module, keyed by name
+        """
+        super().__init__()
+
+        cores = {id(network.core) for network in networks.values()}
+        if len(cores) != 1:
+            raise ValueError("Networks must share the same core module")
+
+        self.networks = ModuleDict(networks)
+
+    @property
+    def core(self):
+        """
+        Returns
+        -------
+        fnn.model.cores.Core
+            shared core model
+        """
+        return next(iter(self.networks.values())).core
+
+    def forward(self, stimulus, perspective, modulation, stream=None, periphery="dark"):
+        """
+        Parameters
+        ----------
+        stimulus : 4D Tensor
+            [N, C, H, W] -- stimulus frame
+        perspective : 2D Tensor | Mapping[str, 2D Tensor]
+            [N, P] -- perspective frame, shared or per network
+        modulation : 2D Tensor | Mapping[str, 2D Tensor]
+            [N, M] -- modulation frame, shared or per network
+        stream : int | None
+            specific stream (int) or all streams (None)
+        periphery : str
+            "dark" | "extend"
+
+        Returns
+        -------
+        dict[str, 2D Tensor]
+            {name: [N, U]} -- response frame of each network
+        """
+        select = lambda x, key: x[key] if isinstance(x, Mapping) else x
+
+        inputs = [
+            network._inputs(
+                stimulus=stimulus,
+                perspective=select(perspective, key),
+                modulation=select(modulation, key),
+                stream=stream,
+                periphery=periphery,
+            )
+            for key, network in self.networks.items()
+        ]
+        core = self.core(
+            perspective=torch.cat([p for p, _ in inputs], dim=0),
+            modulation=torch.cat([m for _, m in inputs], dim=0),
+            stream=stream,
+        )
+        cores = core.split(stimulus.size(0), dim=0)
+
+        return {
+            key: network.unit(readout=network._outputs(core=c, stream=stream))
+            for (key, network), c in zip(self.networks.items(), cores)
+        }
+
+    def generate_response(self, stimuli, perspectives=None, modulations=None, training=False, reset=True):
+        """
+        Parameters
+        ----------
+        stimuli : Iterable[2D|3D|4D array] | 5D Tensor
+            T x [H, W] (singular) | T x [H, W, C] (singular) | T x [N, H, W, C] (batch)
+            | [T, N, C, H, W] (batch Tensor) --- dtype=uint8
+        perspectives : Iterable[1D|2D array] | 3D Tensor | None
+            T x [P] (singular) | T x [N, P] (batch) | [T, N, P] (batch Tensor) --- dtype=float
+        modulations : Iterable[1D|2D array] | 3D Tensor | None
+            T x [M] (singular) | T x [N, M] (batch) | [T, N, M] (batch Tensor) --- dtype=float
+        training : bool
+            training or inference mode
+        reset : bool
+            reset or continue state
+
+        Yields
+        ------
+        dict[str, 1D|2D array | 1D|2D Tensor]
+            {name: [U] (singular input) | [N, U] (batch input)} -- array (training=False) or Tensor (training=True)
+        """
+        if reset:
+            self.reset()
+
+        if perspectives is None:
+            perspectives = repeat(None)
+
+        if modulations is None:
+            modulations = repeat(None)
+
+        network = next(iter(self.networks.values()))
+
+        with self.train_context(training):
+
+            device = self.device
+            stimuli, perspectives, modulations = (
+                to_device(x, device) for x in [stimuli, perspectives, modulations]
+            )
+
+            for inputs in zip(stimuli, perspectives, modulations):
+
+                *tensors, squeeze = network.to_tensor(*inputs)
+                responses = self(*tensors)
+
+                for key, response in responses.items():
+
+                    if squeeze:
+                        response = response.squeeze(0)
+
+                    if not training:
+                        response = response.cpu().numpy()
+
+                    responses[key] = response
+
+                yield responses
+
+    def predict(self, stimuli, perspectives=None, modulations=None):
+        """
+        Parameters
+        ----------
+        stimuli : Iterable[2D|3D|4D array] | 5D Tensor
+            T x [H, W] (singular) | T x [H, W, C] (singular) | T x [N, H, W, C] (batch)
+            | [T, N, C, H, W] (batch Tensor) --- dtype=uint8
+        perspectives : Iterable[1D|2D array] | 3D Tensor | None
+            T x [P] (singular) | T x [N, P] (batch) | [T, N, P] (batch Tensor) --- dtype=float
+        modulations : Iterable[1D|2D array] | 3D Tensor | None
+            T x [M] (singular) | T x [N, M] (batch) | [T, N, M] (batch Tensor) --- dtype=float
+
+        Returns
+        -------
+        dict[str, 2D array | 3D array]
+            {name: [T, U] (singular input) | [T, N, U] (batch input)} -- dtype=float
+        """
+        responses = [*self.generate_response(stimuli, perspectives, modulations)]
+        return {key: np.array([r[key] for r in responses]) for key in self.networks}
@@ -1,8 +1,10 @@
+import torch
 from functools import reduce
+from collections import OrderedDict
 from torch.nn import init
 from .modules import Module, ModuleList
 from .elements import Linear, FlatDropout, Mlp, nonlinearity
-from .utils import isotropic_grid_sample_2d, rmat_3d
+from .utils import isotropic_grid_sample_2d, isotropic_grid_sample_matrix, sparse_grid_sample_2d, rmat_3d
 
 
 # -------------- Perspective Base --------------
@@ -11,6 +13,8 @@ from .utils import isotropic_grid_sample_2d, rmat_3d
 class Perspective(Module):
     """Perspective Module"""
 
+    _fixed_grid = None
+
     def _init(self, stimuli, perspectives):
         """
         Parameters
@@ -32,6 +36,174 @@ class Perspective(Module):
         """
         raise NotImplementedError()
 
+    def grid(self, perspective, batch_size=1):
+        """
+        Parameters
+        ----------
+        perspective : Tensor
+            [N, F]
+        batch_size : int
+            batch size (N)
+
+        Returns
+        -------
+        Tensor
+            [N, H', W', 2] -- stimulus sampling grid
+        """
+        raise NotImplementedError()
+
+    def cached_grid(self, perspective, batch_size=1):
+        """Sampling grid from a least recently used cache keyed by the perspective
+
+        The cache is cleared whenever the module is reset or its parameters are modified, so training-mode
+        noise, which is sampled once per reset, and parameter updates are never served stale.
+
+        Building the key copies the perspective to the host, which synchronizes with the device on every call, so
+        the cache only pays off when perspectives repeat (e.g. fixed or quantized perspectives).
+
+        Parameters
+        ----------
+        perspective : Tensor
+            [N, F]
+        batch_size : int
+            batch size (N)
+
+        Returns
+        -------
+        Tensor
+            [N, H', W', 2] -- stimulus sampling grid
+        """
+        if not self.grid_cache or perspective.requires_grad:
+            return self.grid(perspective, batch_size)
+
+        versions = tuple(p._version for p in self.parameters())
+        if versions != self._grid_versions:
+            self._grids.clear()
+            self._grid_versions = versions
+
+        x = perspective.detach()
+        if self.grid_quantize is not None:
+            x = torch.round(x / self.grid_quantize)
+
+        key = (
+            batch_size,
+            self.training,
+            torch.is_grad_enabled(),
+            torch.is_inference_mode_enabled(),
+            str(x.device),
+            tuple(x.shape),
+            x.cpu().numpy().tobytes(),
+        )
+        grid = self._grids.get(key)
+
+        if grid is None:
+            grid = self._grids[key] = self.grid(perspective, batch_size)
+            if len(self._grids) > self.grid_cache:
+                self._grids.popitem(last=False)
+        else:
+            self._grids.move_to_end(key)
+
+        return grid
+
+    @property
+    def fixed(self):
+        """
+        Returns
+        -------
+        bool
+            whether the sampling grid is fixed
+        """
+        return self._fixed_grid is not None
+
+    def matches(self, size, pad_mode="zeros"):
+        """
+        Parameters
+        ----------
+        size : Tuple[int, int]
+            stimulus height and width (H, W)
+        pad_mode : str
+            "zeros" | "replicate"
+
+        Returns
+        -------
+        bool
+            whether the fixed sampling grid applies to stimuli of the given size and pad_mode
+        """
+        fixed = self._fixed_grid
+        return fixed is not None and fixed["size"] == tuple(size) and fixed["pad_mode"] == pad_mode
+
+    def fix_grid(self, perspective, height=144, width=256, pad_mode="zeros"):
+        """Fixes the sampling grid to a sparse resampling matrix of one perspective
+
+        While the grid is fixed, forward ignores its perspective argument for stimuli of the given size and
+        pad_mode, and also accepts clips of stimulus frames. The resampling matrix is moved to the device of the
+        stimulus when needed. The grid should be fixed again after the parameters of the module are changed.
+
+        Parameters
+        ----------
+        perspective : 1D array | 1D Tensor
+            [F] -- perspective
+        height : int
+            stimulus height (H)
+        width : int
+            stimulus width (W)
+        pad_mode : str
+            "zeros" | "replicate"
+        """
+        perspective = torch.as_tensor(perspective, dtype=torch.float, device=self.device).view(1, -1)
+        training = self.training
+
+        try:
+            self.reset().train(False)
+            with torch.no_grad():
+                grid = self.grid(perspective).squeeze(0)
+        finally:
+            self.reset().train(training)
+
+        self._fixed_grid = dict(
+            matrix=isotropic_grid_sample_matrix(grid, height=height, width=width, pad_mode=pad_mode),
+            size=(int(height), int(width)),
+            out_size=tuple(grid.shape[:2]),
+            pad_mode=str(pad_mode),
+        )
+
+    def release_grid(self):
+        """Releases the fixed sampling grid"""
+        self._fixed_grid = None
+
+    def sample(self, stimulus, perspective, pad_mode="zeros"):
+        """
+        Parameters
+        ----------
+        stimulus : Tensor
+            [N, S, H, W] | [N, S, T, H, W] (fixed grid)
+        perspective : Tensor
+            [N, F]
+        pad_mode : str
+            "zeros" | "replicate"
+
+        Returns
+        -------
+        Tensor
+            [N, S, H', W'] | [N, S, T, H', W'] (fixed grid) -- stimulus sampled onto the retina
+        """
+        if self.matches(stimulus.shape[-2:], pad_mode):
+            fixed = self._fixed_grid
+            if fixed["matrix"].device != stimulus.device:
+                fixed["matrix"] = fixed["matrix"].to(device=stimulus.device)
+
+            height, width = fixed["out_size"]
+            return sparse_grid_sample_2d(stimulus, matrix=fixed["matrix"], height=height, width=width)
+
+        elif stimulus.ndim == 5:
+            raise ValueError("Stimulus clips require a matching fixed sampling grid")
+
+        else:
+            size = max(stimulus.size(0), perspective.size(0))
+            grid = self.cached_grid(perspective, size)
+            stimulus = stimulus.expand(size, -1, -1, -1)
+            return isotropic_grid_sample_2d(stimulus, grid=grid, pad_mode=pad_mode)
+
     def forward(self, stimulus, perspective, pad_mode="zeros"):
         """
         Parameters
@@ -90,6 +262,8 @@ class MonitorRetina(Perspective):
         features,
         nonlinear=None,
         dropout=0,
+        grid_cache=0,
+        grid_quantize=None,
     ):
         """
         Parameters
@@ -112,6 +286,10 @@ class MonitorRetina(Perspective):
             nonlinearity
         dropout : float
             dropout probability -- [0, 1)
+        grid_cache : int
+            number of cached sampling grids, 0 disables the cache
+        grid_quantize : float | None
+            quantization step of the perspective cache key (float) or exact key (None)
         """
         super().__init__()
 
@@ -126,6 +304,11 @@ class MonitorRetina(Perspective):
         self.nonlinear, self.gamma = nonlinearity(nonlinear=nonlinear)
         self._dropout = float(dropout)
 
+        self.grid_cache = int(grid_cache)
+        self.grid_quantize = None if grid_quantize is None else float(grid_quantize)
+        self._grids = OrderedDict()
+        self._grid_versions = None
+
     def _init(self, stimuli, perspectives):
         """
         Parameters
@@ -152,6 +335,9 @@ class MonitorRetina(Perspective):
     def _restart(self):
         self.dropout(p=self._dropout)
 
+    def _reset(self):
+        self._grids.clear()
+
     @property
     def channels(self):
         """
@@ -179,12 +365,30 @@ class MonitorRetina(Perspective):
         x = self.out(x)
         return rmat_3d(*x.unbind(1))
 
+    def grid(self, perspective, batch_size=1):
+        """
+        Parameters
+        ----------
+        perspective : Tensor
+            [N, F]
+        batch_size : int
+            batch size (N)
+
+        Returns
+        -------
+        Tensor
+            [N, H', W', 2] -- stimulus sampling grid
+        """
+        rmat = self.rmat(perspective).expand(batch_size, -1, -1)
+        rays = self.retina.rays(rmat)
+        return self.monitor.project(rays)
+
     def forward(self, stimulus, perspective, pad_mode="zeros"):
         """
         Parameters
         ----------
         stimulus : Tensor
-            [N, S, H, W]
+            [N, S, H, W] | [N, S, T, H, W] (fixed grid)
         perspective : Tensor
             [N, F]
         pad_mode : str
@@ -193,16 +397,10 @@ class MonitorRetina(Perspective):
         Returns
         -------
         Tensor
-            [N, P, H', W']
+            [N, P, H', W'] | [N, P, T, H', W'] (fixed grid)
         """
-        size = max(stimulus.size(0), perspective.size(0))
-
-        rmat = self.rmat(perspective).expand(size, -1, -1)
-        rays = self.retina.rays(rmat)
-        grid = self.monitor.project(rays)
-
-        pixels = self.monitor_pixel(stimulus).expand(size, -1, -1, -1)
-        pixels = isotropic_grid_sample_2d(pixels, grid=grid, pad_mode=pad_mode)
+        pixels = self.monitor_pixel(stimulus)
+        pixels = self.sample(pixels, perspective, pad_mode=pad_mode)
         pixels = self.retina_pixel(pixels)
 
         return pixels
@@ -254,6 +452,8 @@ class MlpMonitorRetina(Perspective):
         retina_pixel,
         height,
         width,
+        grid_cache=0,
+        grid_quantize=None,
     ):
         """
         Parameters
@@ -276,6 +476,10 @@ class MlpMonitorRetina(Perspective):
             retina height
         width : int
             retina width
+        grid_cache : int
+            number of cached sampling grids, 0 disables the cache
+        grid_quantize : float | None
+            quantization step of the perspective cache key (float) or exact key (None)
         """
         super().__init__()
 
@@ -292,6 +496,14 @@ class MlpMonitorRetina(Perspective):
         self.height = int(height)
         self.width = int(width)
 
+        self.grid_cache = int(grid_cache)
+        self.grid_quantize = None if grid_quantize is None else float(grid_quantize)
+        self._grids = OrderedDict()
+        self._grid_versions = None
+
+    def _reset(self):
+        self._grids.clear()
+
     def _init(self, stimuli, perspectives):
         """
         Parameters
@@ -340,12 +552,30 @@ class MlpMonitorRetina(Perspective):
         """
         return rmat_3d(*self.mlp(perspective).unbind(1))
 
+    def grid(self, perspective, batch_size=1):
+        """
+        Parameters
+        ----------
+        perspective : Tensor
+            [N, F]
+        batch_size : int
+            batch size (N)
+
+        Returns
+        -------
+        Tensor
+            [N, H', W', 2] -- stimulus sampling grid
+        """
+        rmat = self.rmat(perspective).expand(batch_size, -1, -1)
+        rays = self.retina.rays(rmat)
+        return self.monitor.project(rays)
+
     def forward(self, stimulus, perspective, pad_mode="zeros"):
         """
         Parameters
         ----------
         stimulus : Tensor
-            [N, S, H, W]
+            [N, S, H, W] | [N, S, T, H, W] (fixed grid)
         perspective : Tensor
             [N, F]
         pad_mode : str
@@ -354,16 +584,10 @@ class MlpMonitorRetina(Perspective):
         Returns
         -------
         Tensor
-            [N, P, H', W']
+            [N, P, H', W'] | [N, P, T, H', W'] (fixed grid)
         """
-        size = max(stimulus.size(0), perspective.size(0))
-
-        rmat = self.rmat(perspective).expand(size, -1, -1)
-        rays = self.retina.rays(rmat)
-        grid = self.monitor.project(rays)
-
-        pixels = self.monitor_pixel(stimulus).expand(size, -1, -1, -1)
-        pixels = isotropic_grid_sample_2d(pixels, grid=grid, pad_mode=pad_mode)
+        pixels = self.monitor_pixel(stimulus)
+        pixels = self.sample(pixels, perspective, pad_mode=pad_mode)
         pixels = self.retina_pixel(pixels)
 
         return pixels
@@ -18,17 +18,19 @@ class Position(Module):
         """
         raise NotImplementedError()
 
-    def sample(self, batch_size=1):
+    def sample(self, batch_size=1, unit_index=None):
         """
         Parameters
         ----------
         batch_size : int
             batch size (N)
+        unit_index : 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         Tensor
-            [N, U, 2], 2D spatial positions
+            [N, U', 2], 2D spatial positions
         """
         raise NotImplementedError()
 
@@ -86,21 +88,37 @@ class Gaussian(Position):
     def _reset(self):
         self.position = None
 
-    def sample(self, batch_size=1):
+    def _get_state(self):
+        if self.position is None:
+            return dict()
+        else:
+            return {"position": self.position}
+
+    def _set_state(self, state, stream=None):
+        self.position = state.get("position")
+
+    def sample(self, batch_size=1, unit_index=None):
         """
         Parameters
         ----------
         batch_size : int
             batch size (N)
+        unit_index : 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         Tensor
-            [N, U, 2], 2D spatial positions
+            [N, U', 2], 2D spatial positions
         """
         if self.position is None:
-            x = self.mu.repeat(batch_size, 1, 1)
-            x = x + torch.einsum("U C D , N U D -> N U C", self.sigma, torch.randn_like(x))
+            mu, sigma = self.mu, self.sigma
+
+            if unit_index is not None:
+                mu, sigma = mu[unit_index], sigma[unit_index]
+
+            x = mu.repeat(batch_size, 1, 1)
+            x = x + torch.einsum("U C D , N U D -> N U C", sigma, torch.randn_like(x))
             self.position = x
 
         else:
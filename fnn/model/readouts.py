@@ -26,7 +26,7 @@ class Readout(Module):
         """
         raise NotImplementedError()
 
-    def forward(self, core, stream=None):
+    def forward(self, core, stream=None, unit_index=None):
         """
         Parameters
         ----------
@@ -36,13 +36,15 @@ class Readout(Module):
             [N, S*C, H, W] -- stream is None
         stream : int | None
             specific stream (int) or all streams (None)
+        unit_index : int | Sequence[int] | 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         Tensor
-            [N, U, R] -- stream is int
+            [N, U', R] -- stream is int
                 or
-            [N, S, U, R] -- stream is None
+            [N, S, U', R] -- stream is None
         """
         raise NotImplementedError()
 
@@ -102,7 +104,7 @@ class PositionFeature(Readout):
         self.biases.decay = False
         self.biases.norm_dim = 0
 
-    def forward(self, core, stream=None):
+    def forward(self, core, stream=None, unit_index=None):
         """
         Parameters
         ----------
@@ -112,18 +114,35 @@ class PositionFeature(Readout):
             [N, S*C, H, W] -- stream is None
         stream : int | None
             specific stream (int) or all streams (None)
+        unit_index : int | Sequence[int] | 1D Tensor | None
+            subset of units (U') or all units (None)
 
         Returns
         -------
         Tensor
-            [N, U, R] -- stream is int
+            [N, U', R] -- stream is int
                 or
-            [N, S, U, R] -- stream is None
+            [N, S, U', R] -- stream is None
         """
+        if unit_index is not None and not (isinstance(unit_index, torch.Tensor) and unit_index.ndim == 1):
+            unit_index = torch.as_tensor(unit_index, dtype=torch.long, device=core.device).view(-1)
+
         if self.training:
-            position = self.position.sample(core.size(0))
+            position = self.position.sample(core.size(0), unit_index=unit_index)
         else:
-            position = self.position.mean.expand(core.size(0), -1, -1)
+            position = self.position.mean
+            if unit_index is not None:
+                position = position[unit_index]
+            position = position.expand(core.size(0), -1, -1)
+
+        feature = self.feature(stream=stream, unit_index=unit_index)
+        if stream is None:
+            biases = torch.stack(list(self.biases), dim=0)
+        else:
+            biases = self.biases[stream]
+
+        if unit_index is not None:
+            biases = biases[..., unit_index, :]
 
         out = functional.grid_sample(
             core,
@@ -132,16 +151,13 @@ class PositionFeature(Readout):
             padding_mode="border",
             align_corners=False,
         )
-        feature = self.feature(stream=stream)
 
         if stream is None:
             out = to_groups_2d(out, self.streams).squeeze(dim=4)
             out = torch.einsum("S U R C , N S C U -> N S U R", feature, out)
-            out = out + torch.stack(list(self.biases), dim=0)
 
         else:
             out = out.squeeze(dim=3)
             out = torch.einsum("U R C , N C U -> N U R", feature, out)
-            out = out + self.biases[stream]
 
-        return out
+        return out + biases
@@ -1,7 +1,7 @@
 import torch
 from .modules import Module
 from .parameters import Parameter, ParameterList
-from .elements import Conv, InterGroup, Accumulate, Dropout
+from .elements import Conv, InterGroup, Accumulate, Gates, Dropout
 from .utils import cat_groups_2d
 
 
@@ -230,6 +230,15 @@ class Rvt(Recurrent):
     def _reset(self):
         self.past.clear()
 
+    def _detach(self):
+        self.past = {k: v.detach() for k, v in self.past.items()}
+
+    def _get_state(self):
+        return dict(self.past)
+
+    def _set_state(self, state, stream=None):
+        self.past = dict(state)
+
     @property
     def channels(self):
         """
@@ -451,32 +460,21 @@ class CvtLstm(Recurrent):
             bias=None,
         )
 
-        self.proj_i = proj(
-            in_channels=self.common_channels * 2,
-            out_channels=self.hidden_channels,
-            gain=1,
-            bias=self.init_input,
-        )
-
-        self.proj_f = proj(
-            in_channels=self.common_channels * 2,
-            out_channels=self.hidden_channels,
-            gain=1,
-            bias=self.init_forget,
-        )
-
-        self.proj_g = proj(
-            in_channels=self.common_channels * 2,
-            out_channels=self.hidden_channels,
-            gain=1,
-            bias=0,
-        )
+        def gate(bias):
+            return proj(
+                in_channels=self.common_channels * 2,
+                out_channels=self.hidden_channels,
+                gain=1,
+                bias=bias,
+            )
 
-        self.proj_o = proj(
-            in_channels=self.common_channels * 2,
-            out_channels=self.hidden_channels,
-            gain=1,
-            bias=0,
+        self.gates = Gates(
+            [
+                gate(bias=self.init_input),
+                gate(bias=self.init_forget),
+                gate(bias=0),
+                gate(bias=0),
+            ]
         )
 
         self.out = Conv(
@@ -493,6 +491,20 @@ class CvtLstm(Recurrent):
     def _reset(self):
         self.past.clear()
 
+    def _detach(self):
+        self.past = {k: v.detach() for k, v in self.past.items()}
+
+    def _get_state(self):
+        return dict(self.past)
+
+    def _set_state(self, state, stream=None):
+        self.past = dict(state)
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        names = [f"{prefix}proj_{gate}." for gate in "ifgo"]
+        Gates.map_state_dict(state_dict, f"{prefix}gates.", names)
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
     @property
     def channels(self):
         """
@@ -556,10 +568,11 @@ class CvtLstm(Recurrent):
         a = torch.einsum("N S G C D , N S G Q D -> N S G C Q", v, w).view(N, -1, H, W)
 
         za = cat_groups_2d([z, a], groups=S * self.groups, expand=True)
-        i = torch.sigmoid(self.proj_i(za, stream=stream))
-        f = torch.sigmoid(self.proj_f(za, stream=stream))
-        g = torch.tanh(self.proj_g(za, stream=stream))
-        o = torch.sigmoid(self.proj_o(za, stream=stream))
+        i, f, g, o = self.gates(za, stream=stream)
+        i = torch.sigmoid(i)
+        f = torch.sigmoid(f)
+        g = torch.tanh(g)
+        o = torch.sigmoid(o)
 
         c = f * c + i * g
         h = o * torch.tanh(c)
@@ -676,10 +689,14 @@ class ConvLstm(Recurrent):
                 bias=bias,
             )
 
-        self.proj_i = conv(bias=self.init_input)
-        self.proj_f = conv(bias=self.init_forget)
-        self.proj_g = conv(bias=0)
-        self.proj_o = conv(bias=0)
+        self.gates = Gates(
+            [
+                conv(bias=self.init_input),
+                conv(bias=self.init_forget),
+                conv(bias=0),
+                conv(bias=0),
+            ]
+        )
 
         self.out = Conv(
             in_channels=self.hidden_channels,
@@ -695,6 +712,20 @@ class ConvLstm(Recurrent):
     def _reset(self):
         self.past.clear()
 
+    def _detach(self):
+        self.past = {k: v.detach() for k, v in self.past.items()}
+
+    def _get_state(self):
+        return dict(self.past)
+
+    def _set_state(self, state, stream=None):
+        self.past = dict(state)
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        names = [f"{prefix}proj_{gate}." for gate in "ifgo"]
+        Gates.map_state_dict(state_dict, f"{prefix}gates.", names)
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
     @property
     def channels(self):
         """
@@ -740,10 +771,11 @@ class ConvLstm(Recurrent):
             x = torch.tanh(self.proj_x(x, stream=stream))
 
         xh = cat_groups_2d([self.drop_x(x), h], groups=S * self.groups, expand=True)
-        i = torch.sigmoid(self.proj_i(xh, stream=stream))
-        f = torch.sigmoid(self.proj_f(xh, stream=stream))
-        g = torch.tanh(self.proj_g(xh, stream=stream))
-        o = torch.sigmoid(self.proj_o(xh, stream=stream))
+        i, f, g, o = self.gates(xh, stream=stream)
+        i = torch.sigmoid(i)
+        f = torch.sigmoid(f)
+        g = torch.tanh(g)
+        o = torch.sigmoid(o)
 
         c = f * c + i * g
         h = o * torch.tanh(c)
@@ -20,6 +20,27 @@ def add(tensors):
     return reduce(torch.Tensor.add, tensors)
 
 
+def to_device(x, device):
+    """Moves a tensor to a device
+
+    Parameters
+    ----------
+    x : Tensor | Any
+        tensor to move, other types are returned unchanged
+    device : torch.device
+        target device
+
+    Returns
+    -------
+    Tensor | Any
+        tensor on the device (non-blocking copy from pinned memory)
+    """
+    if isinstance(x, torch.Tensor):
+        return x.to(device=device, non_blocking=True)
+    else:
+        return x
+
+
 def to_groups(tensor, groups):
     """Reshapes a (N, F) tensor to feature groups
 
@@ -68,31 +89,31 @@ def cat_groups(tensors, groups, expand=False):
 
 
 def to_groups_2d(tensor, groups):
-    """Reshapes a 2D (N, C, H, W) tensor to channel groups
+    """Reshapes a 2D (N, C, H, W) or clip of 2D (N, C, T, H, W) tensor to channel groups
 
     Parameters
     ----------
     tensor : Tensor
-        [N, C, H, W]
+        [N, C, H, W] | [N, C, T, H, W]
     groups : int
         channel groups (G)
 
     Returns
     -------
     Tensor
-        [N, G, C//G, H, W]
+        [N, G, C//G, H, W] | [N, G, C//G, T, H, W]
     """
-    N, _, H, W = tensor.shape
-    return tensor.view(N, groups, -1, H, W)
+    N, _, *dims = tensor.shape
+    return tensor.view(N, groups, -1, *dims)
 
 
 def cat_groups_2d(tensors, groups, expand=False):
-    """Groupwise concatenation of 2D (N, C, H, W) tensors along the channel dimension (C)
+    """Groupwise concatenation of 2D (N, C, H, W) or clip of 2D (N, C, T, H, W) tensors along the channel dimension (C)
 
     Parameters
     ----------
     tensors : Sequence[Tensor]
-        [[N, C, H, W], ...]
+        [[N, C, H, W], ...] | [[N, C, T, H, W], ...]
     groups : int
         channel groups (G)
     expand : bool
@@ -101,11 +122,11 @@ def cat_groups_2d(tensors, groups, expand=False):
     Returns
     -------
     Tensor
-        [N, C', H, W]
+        [N, C', H, W] | [N, C', T, H, W]
     """
     if expand:
-        N, _, H, W = tensors[0].shape
-        tensors = tensors[:1] + [t.expand(N, -1, H, W) for t in tensors[1:]]
+        N, _, *dims = tensors[0].shape
+        tensors = tensors[:1] + [t.expand(N, -1, *dims) for t in tensors[1:]]
 
     if groups == 1:
         return torch.cat(tensors, 1)
@@ -278,6 +299,108 @@ def isotropic_grid_sample_2d(x, grid, major="x", pad_mode="zeros", pad_value=0):
     return finalize(x)
 
 
+def isotropic_grid_sample_matrix(grid, height, width, major="x", pad_mode="zeros"):
+    """Sparse matrix of isotropic 2D sampling with a fixed grid
+
+    Parameters
+    ----------
+    grid : Tensor
+        [H', W', 2]
+    height : int
+        input height (H)
+    width : int
+        input width (W)
+    major : str
+        "x" | "y" , axis by which sampling is scaled
+    pad_mode : str
+        "zeros" | "replicate" -- padding mode for out-of-bounds grid values
+
+    Returns
+    -------
+    Tensor
+        [H'*W', H*W] -- sparse CSR matrix of bilinear interpolation weights
+    """
+    grid_x, grid_y = grid.unbind(dim=2)
+
+    if major == "x":
+        grid_y = grid_y * width / height
+        scale = width / (width - 1)
+
+    elif major == "y":
+        grid_x = grid_x * height / width
+        scale = height / (height - 1)
+
+    else:
+        raise ValueError("major must be either 'x' or 'y'")
+
+    _height, _width, _ = grid.shape
+    x = ((grid_x * scale * (_width - 1) / _width + 1) * width - 1) / 2
+    y = ((grid_y * scale * (_height - 1) / _height + 1) * height - 1) / 2
+
+    if pad_mode == "replicate":
+        x = x.clip(0, width - 1)
+        y = y.clip(0, height - 1)
+
+    elif pad_mode != "zeros":
+        raise ValueError("pad_mode must either be 'zeros' or 'replicate'")
+
+    x0 = x.floor()
+    y0 = y.floor()
+    x1 = x - x0
+    y1 = y - y0
+
+    rows = torch.arange(_height * _width, device=grid.device).view(_height, _width)
+    corners = [
+        [x0, y0, (1 - x1) * (1 - y1)],
+        [x0 + 1, y0, x1 * (1 - y1)],
+        [x0, y0 + 1, (1 - x1) * y1],
+        [x0 + 1, y0 + 1, x1 * y1],
+    ]
+    indices = []
+    values = []
+
+    for _x, _y, weight in corners:
+        valid = (_x >= 0) & (_x < width) & (_y >= 0) & (_y < height)
+        cols = (_y[valid] * width + _x[valid]).long()
+        indices.append(torch.stack([rows[valid], cols], dim=0))
+        values.append(weight[valid])
+
+    matrix = torch.sparse_coo_tensor(
+        indices=torch.cat(indices, dim=1),
+        values=torch.cat(values, dim=0),
+        size=[_height * _width, height * width],
+        check_invariants=False,
+    )
+    return matrix.coalesce().to_sparse_csr()
+
+
+def sparse_grid_sample_2d(x, matrix, height, width):
+    """2D sampling with a sparse matrix from isotropic_grid_sample_matrix
+
+    All leading dimensions, e.g. the frames of a clip, are sampled in one sparse matrix multiplication.
+
+    Parameters
+    ----------
+    x : Tensor
+        [..., H, W]
+    matrix : Tensor
+        [H'*W', H*W] -- sparse CSR matrix
+    height : int
+        output height (H')
+    width : int
+        output width (W')
+
+    Returns
+    -------
+    Tensor
+        [..., H', W']
+    """
+    *dims, _height, _width = x.shape
+    x = x.reshape(-1, _height * _width)
+    x = torch.sparse.mm(matrix, x.T).T
+    return x.reshape(*dims, height, width)
+
+
 class Gaussian3d(nn.Module):
     """3D (Spatiotemporal) Gaussian Blur"""
 
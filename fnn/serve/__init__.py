@@ -0,0 +1,2 @@
+from .sessions import Sessions
+from .server import Worker, Server, Client
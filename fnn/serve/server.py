@@ -0,0 +1,465 @@
+import io
+import json
+import socket
+import numpy as np
+from time import perf_counter
+from queue import Queue
+from threading import Thread, Condition
+from collections import deque
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from urllib.parse import urlparse
+from .sessions import Sessions
+from fnn.utils import logging
+
+logger = logging.get_logger(__name__)
+
+
+def percentiles(x, q=(50, 90, 99)):
+    """
+    Parameters
+    ----------
+    x : Sequence[float]
+        samples
+    q : Sequence[int]
+        percentiles
+
+    Returns
+    -------
+    dict[str, float]
+        {"p{q}": percentile}
+    """
+    if len(x):
+        return {f"p{_q}": float(p) for _q, p in zip(q, np.percentile(x, q))}
+    else:
+        return {f"p{_q}": None for _q in q}
+
+
+def validate(stimuli, perspectives=None, modulations=None):
+    """
+    Parameters
+    ----------
+    stimuli : 3D|4D array | None
+        [T, H, W] | [T, H, W, C] -- stimulus frames, dtype=np.uint8
+    perspectives : 2D array | None
+        [T, P] -- perspective frames
+    modulations : 2D array | None
+        [T, M] -- modulation frames
+
+    Raises
+    ------
+    ValueError
+        if the arrays are missing or malformed
+    """
+    if stimuli is None:
+        raise ValueError("Missing stimuli array")
+
+    if stimuli.dtype != np.uint8:
+        raise ValueError(f"Stimuli dtype must be uint8, not {stimuli.dtype}")
+
+    if stimuli.ndim not in (3, 4):
+        raise ValueError(f"Stimuli must be [T, H, W] or [T, H, W, C], not {list(stimuli.shape)}")
+
+    for name, frames in [["perspectives", perspectives], ["modulations", modulations]]:
+        if frames is None:
+            continue
+
+        if frames.ndim != 2:
+            raise ValueError(f"{name.capitalize()} must be [T, F], not {list(frames.shape)}")
+
+        if len(frames) != len(stimuli):
+            raise ValueError(f"{name.capitalize()} have {len(frames)} frames, but stimuli have {len(stimuli)}")
+
+
+class Worker:
+    """Batches the frames of concurrent requests to one network"""
+
+    def __init__(self, network, stream=None, batch_size=None, history=1000):
+        """
+        Parameters
+        ----------
+        network : fnn.model.networks.Visual
+            visual network
+        stream : int | None
+            specific stream (int) or all streams (None)
+        batch_size : int | None
+            maximum number of requests per step (int) or unlimited (None)
+        history : int
+            number of latencies kept for the percentiles
+        """
+        self.sessions = Sessions(network, stream=stream, batch_size=batch_size)
+        self.queues = dict()
+        self.condition = Condition()
+        self.closed = False
+
+        self.timing = {k: deque(maxlen=history) for k in ["tick", "batch", "first", "total"]}
+
+        self.thread = Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not (self.closed or self.sessions.pending()):
+                    self.condition.wait()
+
+                if self.closed:
+                    return
+
+                t = perf_counter()
+                try:
+                    responses = self.sessions.tick()
+                except Exception as e:
+                    logger.exception("Network step failed")
+                    responses = {session: e for session, frames in self.sessions.frames.items() if frames}
+                    for session in responses:
+                        self.sessions.frames[session].clear()
+
+                self.timing["tick"].append(perf_counter() - t)
+                self.timing["batch"].append(len(responses))
+
+                for session, response in responses.items():
+                    self.queues[session].put(response)
+
+    def predict(self, stimuli, perspectives=None, modulations=None):
+        """
+        Parameters
+        ----------
+        stimuli : 3D|4D array
+            [T, H, W] | [T, H, W, C] -- stimulus frames
+        perspectives : 2D array | None
+            [T, P] -- perspective frames
+        modulations : 2D array | None
+            [T, M] -- modulation frames
+
+        Yields
+        ------
+        1D array
+            [U] -- response frame
+        """
+        T = len(stimuli)
+        perspectives = [None] * T if perspectives is None else perspectives
+        modulations = [None] * T if modulations is None else modulations
+
+        if not len(perspectives) == len(modulations) == T:
+            raise ValueError("Stimuli, perspectives, and modulations must have the same number of frames")
+
+        queue = Queue()
+        t = perf_counter()
+
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("Worker is closed")
+
+            session = self.sessions.open()
+            self.queues[session] = queue
+
+            for frame in zip(stimuli, perspectives, modulations):
+                self.sessions.submit(session, *frame)
+
+            self.condition.notify()
+
+        try:
+            for i in range(T):
+                response = queue.get()
+
+                if isinstance(response, Exception):
+                    raise response
+
+                if i == 0:
+                    self.timing["first"].append(perf_counter() - t)
+
+                yield response
+
+            self.timing["total"].append(perf_counter() - t)
+
+        finally:
+            with self.condition:
+                self.sessions.close(session)
+                del self.queues[session]
+
+    def stats(self):
+        """
+        Returns
+        -------
+        dict
+            latency percentiles (seconds) of steps and requests, and step batch size percentiles
+        """
+        with self.condition:
+            timing = {k: list(v) for k, v in self.timing.items()}
+
+        return {
+            "requests": len(timing["total"]),
+            "tick": percentiles(timing["tick"]),
+            "batch": percentiles(timing["batch"]),
+            "first": percentiles(timing["first"]),
+            "total": percentiles(timing["total"]),
+        }
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+        self.thread.join()
+
+
+class Handler(BaseHTTPRequestHandler):
+    """HTTP request handler
+
+    GET /models -- names of the served models
+    GET /stats -- latency percentiles of every model
+    POST /predict/{model} -- npz body with stimuli [T, H, W(, C)] and optional perspectives [T, P] and
+        modulations [T, M] arrays, streams back one JSON line per response frame
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def _json(self, obj, status=200):
+        body = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._json({"error": message}, status=status)
+
+    def _chunk(self, data):
+        self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+
+    def do_GET(self):
+        path = urlparse(self.path).path.strip("/")
+        workers = self.server.workers
+
+        if path == "models":
+            self._json(list(workers))
+        elif path == "stats":
+            self._json({name: worker.stats() for name, worker in workers.items()})
+        else:
+            self._error(404, f"Unknown path /{path}")
+
+    def do_POST(self):
+        path = urlparse(self.path).path.strip("/").split("/")
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        if len(path) != 2 or path[0] != "predict":
+            return self._error(404, f"Unknown path /{'/'.join(path)}")
+
+        worker = self.server.workers.get(path[1])
+        if worker is None:
+            return self._error(404, f"Unknown model {path[1]}")
+
+        try:
+            with np.load(io.BytesIO(body)) as data:
+                inputs = {k: data[k] if k in data else None for k in ["stimuli", "perspectives", "modulations"]}
+            validate(**inputs)
+        except Exception as e:
+            return self._error(400, f"Invalid request body: {e}")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        try:
+            for response in worker.predict(**inputs):
+                self._chunk(json.dumps(response.tolist()).encode() + b"\n")
+        except (BrokenPipeError, ConnectionResetError):
+            return
+        except Exception as e:
+            logger.exception("Prediction failed")
+            self._chunk(json.dumps({"error": repr(e)}).encode() + b"\n")
+
+        self._chunk(b"")
+
+
+class HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ["local", 0]
+
+
+class Server:
+    """Local inference server of one or more visual networks"""
+
+    def __init__(self, networks, address=("127.0.0.1", 8000), stream=None, batch_size=None):
+        """
+        Parameters
+        ----------
+        networks : Mapping[str, fnn.model.networks.Visual]
+            visual networks, keyed by model name
+        address : Tuple[str, int] | str
+            (host, port) of an HTTP server or path of a Unix socket
+        stream : int | None
+            specific stream (int) or all streams (None)
+        batch_size : int | None
+            maximum number of requests per step (int) or unlimited (None)
+        """
+        self.workers = {
+            str(name): Worker(network, stream=stream, batch_size=batch_size) for name, network in networks.items()
+        }
+
+        if isinstance(address, str):
+            self.httpd = UnixHTTPServer(address, Handler)
+        else:
+            self.httpd = HTTPServer(tuple(address), Handler)
+
+        self.httpd.workers = self.workers
+        self.thread = None
+
+    @property
+    def address(self):
+        """
+        Returns
+        -------
+        Tuple[str, int] | str
+            (host, port) of an HTTP server or path of a Unix socket
+        """
+        return self.httpd.server_address
+
+    def start(self):
+        """Serves requests in a background thread"""
+        self.thread = Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serves requests until interrupted"""
+        logger.info(f"Serving {list(self.workers)} at {self.address}")
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.close()
+
+    def close(self):
+        if self.thread is not None:
+            self.httpd.shutdown()
+            self.thread.join()
+            self.thread = None
+
+        self.httpd.server_close()
+
+        for worker in self.workers.values():
+            worker.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class UnixHTTPConnection(HTTPConnection):
+    def __init__(self, path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+class Client:
+    """Client of a local inference server"""
+
+    def __init__(self, address=("127.0.0.1", 8000), timeout=None):
+        """
+        Parameters
+        ----------
+        address : Tuple[str, int] | str
+            (host, port) of an HTTP server or path of a Unix socket
+        timeout : float | None
+            socket timeout in seconds
+        """
+        self.address = address
+        self.timeout = timeout
+
+    def _connection(self):
+        if isinstance(self.address, str):
+            return UnixHTTPConnection(self.address, timeout=self.timeout)
+        else:
+            host, port = self.address
+            return HTTPConnection(host, port, timeout=self.timeout)
+
+    def _get(self, path):
+        conn = self._connection()
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            body = json.loads(response.read())
+            if response.status != 200:
+                raise RuntimeError(body["error"])
+            return body
+        finally:
+            conn.close()
+
+    def models(self):
+        """
+        Returns
+        -------
+        List[str]
+            names of the served models
+        """
+        return self._get("/models")
+
+    def stats(self):
+        """
+        Returns
+        -------
+        dict[str, dict]
+            latency percentiles of every model
+        """
+        return self._get("/stats")
+
+    def predict(self, model, stimuli, perspectives=None, modulations=None):
+        """
+        Parameters
+        ----------
+        model : str
+            model name
+        stimuli : 3D|4D array
+            [T, H, W] | [T, H, W, C] -- stimulus frames, dtype=np.uint8
+        perspectives : 2D array | None
+            [T, P] -- perspective frames
+        modulations : 2D array | None
+            [T, M] -- modulation frames
+
+        Yields
+        ------
+        1D array
+            [U] -- response frame
+        """
+        arrays = {"stimuli": stimuli, "perspectives": perspectives, "modulations": modulations}
+        buffer = io.BytesIO()
+        np.savez(buffer, **{k: v for k, v in arrays.items() if v is not None})
+
+        conn = self._connection()
+        try:
+            conn.request("POST", f"/predict/{model}", body=buffer.getvalue())
+            response = conn.getresponse()
+
+            if response.status != 200:
+                raise RuntimeError(json.loads(response.read())["error"])
+
+            for line in response:
+                frame = json.loads(line)
+                if isinstance(frame, dict):
+                    raise RuntimeError(frame["error"])
+                yield np.array(frame, dtype=np.float32)
+
+        finally:
+            conn.close()
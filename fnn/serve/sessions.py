@@ -0,0 +1,173 @@
+import torch
+from time import monotonic
+from itertools import count
+from collections import deque, defaultdict
+
+
+class Sessions:
+    """Streaming inference sessions that share one network
+
+    Every session keeps a snapshot of its own recurrent state. Frames that are pending across sessions are batched
+    into a single network step per tick: the concatenated snapshots are restored into the network, the frames are
+    passed forward, and the next snapshot is split back to the sessions. The network holds the state during a tick,
+    so it must not be used elsewhere concurrently.
+    """
+
+    def __init__(self, network, stream=None, batch_size=None, timeout=None):
+        """
+        Parameters
+        ----------
+        network : fnn.model.networks.Visual
+            visual network
+        stream : int | None
+            specific stream (int) or all streams (None)
+        batch_size : int | None
+            maximum number of sessions per step (int) or unlimited (None)
+        timeout : float | None
+            seconds of inactivity before a session is evicted (float) or never (None)
+        """
+        self.network = network
+        self.stream = None if stream is None else int(stream)
+        self.batch_size = None if batch_size is None else int(batch_size)
+        self.timeout = None if timeout is None else float(timeout)
+
+        self.initial = network.init_snapshot(batch_size=1, stream=self.stream)
+        self.states = dict()
+        self.frames = dict()
+        self.active = dict()
+        self.ids = count()
+
+    def __len__(self):
+        return len(self.states)
+
+    def __contains__(self, session):
+        return session in self.states
+
+    def open(self, session=None):
+        """
+        Parameters
+        ----------
+        session : Hashable | None
+            session key (Hashable) or automatically assigned (None)
+
+        Returns
+        -------
+        Hashable
+            session key
+        """
+        if session is None:
+            session = next(self.ids)
+            while session in self.states:
+                session = next(self.ids)
+
+        elif session in self.states:
+            raise KeyError(f"Session {session} already exists")
+
+        self.states[session] = self.initial
+        self.frames[session] = deque()
+        self.active[session] = monotonic()
+
+        return session
+
+    def close(self, session):
+        """
+        Parameters
+        ----------
+        session : Hashable
+            session key
+        """
+        del self.states[session]
+        del self.frames[session]
+        del self.active[session]
+
+    def submit(self, session, stimulus, perspective=None, modulation=None):
+        """
+        Parameters
+        ----------
+        session : Hashable
+            session key
+        stimulus : 2D|3D array
+            [H, W] | [H, W, C] -- stimulus frame
+        perspective : 1D array | None
+            [P] -- perspective frame
+        modulation : 1D array | None
+            [M] -- modulation frame
+        """
+        if session not in self.states:
+            raise KeyError(f"Session {session} does not exist")
+
+        self.frames[session].append([stimulus, perspective, modulation])
+        self.active[session] = monotonic()
+
+    def pending(self):
+        """
+        Returns
+        -------
+        int
+            number of sessions with pending frames
+        """
+        return sum(map(bool, self.frames.values()))
+
+    def evict(self):
+        """
+        Returns
+        -------
+        List[Hashable]
+            keys of the evicted sessions
+        """
+        if self.timeout is None:
+            return []
+
+        now = monotonic()
+        evicted = [session for session, t in self.active.items() if now - t > self.timeout]
+
+        for session in evicted:
+            self.close(session)
+
+        return evicted
+
+    def tick(self):
+        """Steps the network once for every session with a pending frame
+
+        Returns
+        -------
+        dict[Hashable, 1D array]
+            {session key: [U]} -- response frame of each stepped session
+        """
+        self.evict()
+
+        sessions = [session for session, frames in self.frames.items() if frames]
+        if self.batch_size is not None:
+            sessions = sorted(sessions, key=self.active.get)[: self.batch_size]
+
+        groups = defaultdict(list)
+        for session in sessions:
+            stimulus, perspective, modulation = self.frames[session].popleft()
+            tensors = self.network.to_tensor(stimulus, perspective, modulation)[:3]
+            groups[tensors[0].shape, tuple(self.states[session])].append([session, *tensors])
+
+        responses = dict()
+
+        with self.network.train_context(False):
+
+            for group in groups.values():
+                keys, stimuli, perspectives, modulations = zip(*group)
+
+                state = {k: torch.cat([self.states[s][k] for s in keys]) for k in self.states[keys[0]]}
+                self.network.restore(state, stream=self.stream)
+
+                response = self.network(
+                    stimulus=torch.cat(stimuli),
+                    perspective=torch.cat(perspectives),
+                    modulation=torch.cat(modulations),
+                    stream=self.stream,
+                )
+                response = response.cpu().numpy()
+                state = self.network.snapshot()
+
+                for i, session in enumerate(keys):
+                    self.states[session] = {k: v[i : i + 1] for k, v in state.items()}
+                    self.active[session] = monotonic()
+                    responses[session] = response[i]
+
+        return responses
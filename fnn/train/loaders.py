@@ -1,7 +1,13 @@
 import numpy as np
+import traceback
+from time import perf_counter
+from collections import deque
 from tqdm import tqdm
-from torch import randint
-from torch.multiprocessing import spawn, Queue
+import torch
+import torch.distributed as dist
+from torch import randint, randperm, manual_seed
+from torch.random import fork_rng
+from torch.multiprocessing import get_context
 
 
 # -------------- Loader Base --------------
@@ -26,6 +32,16 @@ class Loader:
         """
         raise NotImplementedError()
 
+    def step(self):
+        """Perform an epoch step
+
+        Returns
+        -------
+        dict
+            epoch info
+        """
+        return dict()
+
 
 # -------------- Loader Types --------------
 
@@ -45,10 +61,47 @@ class DatasetLoader(Loader):
         raise NotImplementedError()
 
 
+def _load_batches(dataset, buffers, tasks, results):
+    """
+    Parameters
+    ----------
+    dataset : fnn.data.dataset.Dataset
+        dataset to load
+    buffers : dict[str, Tensor]
+        [S, T, N, ...] -- shared memory ring buffer of data items
+    tasks : Queue
+        (batch id, slot, keys, indexes) or None to stop
+    results : Queue
+        (batch id, None, read time) or (batch id, RuntimeError, read time)
+    """
+    buffers = {k: v.numpy() for k, v in buffers.items()}
+
+    for b, slot, keys, indexes in iter(tasks.get, None):
+        t = perf_counter()
+        try:
+            out = {k: v[slot, :, : len(keys)] for k, v in buffers.items()}
+            dataset.load_batch(keys, indexes, out=out)
+            results.put((b, None, perf_counter() - t))
+        except Exception:
+            results.put((b, RuntimeError(traceback.format_exc()), perf_counter() - t))
+
+
 class Batches(DatasetLoader):
     """Randomly Sampled Batches"""
 
-    def __init__(self, sample_size, batch_size, training_size, validation_size):
+    def __init__(
+        self,
+        sample_size,
+        batch_size,
+        training_size,
+        validation_size,
+        workers=1,
+        prefetch=2,
+        sharded=False,
+        windows=1,
+        validation_seed=None,
+        tensors=False,
+    ):
         """
         Parameters
         ----------
@@ -60,16 +113,54 @@ class Batches(DatasetLoader):
             number of training batches in an epoch
         validation_size : int
             number of validation batches in an epoch
+        workers : int
+            number of persistent loader processes, 0 loads in the calling process
+        prefetch : int
+            number of batches requested ahead of the one being consumed
+        sharded : bool
+            partition trials across torch.distributed ranks and sample windows without replacement within an epoch
+        windows : int
+            maximum number of consecutive windows walked per trial, batches are marked with a `reset` flag if > 1
+        validation_seed : int | None
+            seed of a fixed set of validation batches that are loaded once and kept in memory,
+            or None to resample the validation batches every call
+        tensors : bool
+            yield torch tensors instead of arrays -- [T, N, H, W, C] items as [T, N, C, H, W],
+            floating point items as float32, staged in pinned memory if CUDA is available
+
+        Notes
+        -----
+        With workers > 0, batches are written into a shared memory ring buffer of (prefetch + 1) slots,
+        and the yielded arrays are views of a slot that are valid until the next batch is requested.
+
+        With tensors and CUDA, batches are staged in two alternating pinned memory buffers, and the yielded
+        tensors are valid until the second next batch is requested. Before a buffer is reused, the host to device
+        copies that were enqueued from it on the current stream are waited for.
         """
         assert sample_size > 0
         assert batch_size > 0
         assert training_size >= 0
         assert validation_size >= 0
+        assert workers >= 0
+        assert prefetch > 0
+        assert windows > 0
 
         self.sample_size = int(sample_size)
         self.batch_size = int(batch_size)
         self.training_size = int(training_size)
         self.validation_size = int(validation_size)
+        self.workers = int(workers)
+        self.prefetch = int(prefetch)
+        self.sharded = bool(sharded)
+        self.windows = int(windows)
+        self.validation_seed = None if validation_seed is None else int(validation_seed)
+        self.validation = None
+        self.tensors = bool(tensors)
+        self.pinned = [dict(), dict()]
+        self.pinned_events = [None, None]
+        self.pinned_slot = 0
+        self.processes = []
+        self.timing = dict.fromkeys(["batches", "frames", "wait", "read", "elapsed"], 0)
 
     def _init(self, dataset):
         """
@@ -80,6 +171,57 @@ class Batches(DatasetLoader):
         """
         assert dataset.df.samples.min() >= self.sample_size
         self.dataset = dataset
+        self.validation = None
+
+        if self.sharded:
+            assert len(self._shard_keys(training=True)) > 0, "Rank has no training trials"
+
+        self.close()
+
+        if not self.workers:
+            return
+
+        key = self.dataset.df.index[0]
+        sample = self.dataset.load_batch([key], [np.arange(self.sample_size)])
+        slots = self.prefetch + 1
+
+        self.buffers = dict()
+
+        for k, v in sample.items():
+            shape = [slots, self.sample_size, self.batch_size, *v.shape[2:]]
+
+            if self.tensors and v.ndim == 5:
+                H, W, C = shape[3:]
+                buffer = torch.from_numpy(np.empty([*shape[:3], C, H, W], dtype=v.dtype))
+                self.buffers[k] = buffer.share_memory_().permute(0, 1, 2, 4, 5, 3)
+            else:
+                buffer = torch.from_numpy(np.empty(shape, dtype=v.dtype))
+                self.buffers[k] = buffer.share_memory_()
+
+        self.slots = {k: v.numpy() for k, v in self.buffers.items()}
+
+        context = get_context("spawn")
+        self.tasks = context.Queue()
+        self.results = context.Queue()
+
+        for _ in range(self.workers):
+            process = context.Process(
+                target=_load_batches,
+                args=(self.dataset, self.buffers, self.tasks, self.results),
+                daemon=True,
+            )
+            process.start()
+            self.processes.append(process)
+
+    def close(self):
+        """Stop the loader processes"""
+        for _ in self.processes:
+            self.tasks.put(None)
+
+        for process in self.processes:
+            process.join()
+
+        self.processes = []
 
     def _random_keys(self, training=True):
         if training:
@@ -102,11 +244,224 @@ class Batches(DatasetLoader):
         else:
             return np.arange(self.sample_size)
 
-    def _load(self, i, queue, keys, indexes):
-        assert i == 0
-        for key, index in zip(keys, indexes):
-            data = self.dataset.load(key, index)
-            queue.put(data)
+    def _shard_keys(self, training=True):
+        if dist.is_initialized():
+            rank = dist.get_rank()
+            size = dist.get_world_size()
+        else:
+            rank = 0
+            size = 1
+
+        return self.dataset.keys(training=training)[rank::size]
+
+    def _sharded_samples(self, training=True):
+        keys = self._shard_keys(training)
+        if training:
+            size = self.batch_size * self.training_size
+        else:
+            size = self.batch_size * self.validation_size
+
+        if not len(keys) or not size:
+            return [], []
+
+        samples = self.dataset.df.samples.loc[keys].to_numpy()
+        sample_keys = []
+        sample_indexes = []
+
+        while len(sample_keys) < size:
+            windows = []
+            for key, n in zip(keys, samples):
+                offset = randint(high=n % self.sample_size + 1, size=(1,)).item()
+                starts = range(offset, n - self.sample_size + 1, self.sample_size)
+                windows += [(key, start) for start in starts]
+
+            for i in randperm(len(windows)).tolist()[: size - len(sample_keys)]:
+                key, start = windows[i]
+                sample_keys.append(key)
+                sample_indexes.append(start + np.arange(self.sample_size))
+
+        return sample_keys, sample_indexes
+
+    def _consecutive_samples(self, training=True):
+        if self.sharded:
+            keys = self._shard_keys(training)
+        else:
+            keys = self.dataset.keys(training=training)
+
+        if training:
+            size = self.training_size
+        else:
+            size = self.validation_size
+
+        if not len(keys) or not size:
+            return [], []
+
+        order = []
+        batches = []
+        resets = []
+
+        while len(batches) < size:
+            while len(order) < self.batch_size:
+                order += randperm(len(keys)).tolist()
+
+            group = keys[order[: self.batch_size]].tolist()
+            order = order[self.batch_size :]
+
+            samples = self.dataset.df.samples.loc[group].to_numpy()
+            windows = min(self.windows, samples.min() // self.sample_size, size - len(batches))
+            length = windows * self.sample_size
+            starts = [randint(high=n - length + 1, size=(1,)).item() for n in samples]
+
+            for w in range(windows):
+                indexes = [start + w * self.sample_size + np.arange(self.sample_size) for start in starts]
+                batches.append((group, indexes))
+                resets.append(w == 0)
+
+        return batches, resets
+
+    def _load(self, batches):
+        """
+        Parameters
+        ----------
+        batches : Sequence[Tuple[List[hashable], List[1D array]]]
+            keys and indexes of each batch
+
+        Yields
+        ------
+        dict[str, ND array]
+            [T, N, ...] -- batches in order
+        """
+        if not self.processes:
+            for keys, indexes in batches:
+                t = perf_counter()
+                batch = self.dataset.load_batch(keys, indexes)
+                t = perf_counter() - t
+
+                self.timing["wait"] += t
+                self.timing["read"] += t
+
+                yield batch
+            return
+
+        free = deque(range(self.prefetch + 1))
+        slots = dict()
+        done = set()
+        sent = 0
+        received = 0
+
+        try:
+            for b in range(len(batches)):
+
+                while sent < min(b + self.prefetch + 1, len(batches)):
+                    slots[sent] = free.popleft()
+                    self.tasks.put((sent, slots[sent], *batches[sent]))
+                    sent += 1
+
+                t = perf_counter()
+
+                while b not in done:
+                    i, error, read = self.results.get()
+                    received += 1
+                    self.timing["read"] += read
+
+                    if error is not None:
+                        raise error
+
+                    done.add(i)
+
+                self.timing["wait"] += perf_counter() - t
+
+                n = len(batches[b][0])
+                yield {k: v[slots[b], :, :n] for k, v in self.slots.items()}
+
+                done.remove(b)
+                free.append(slots.pop(b))
+
+        finally:
+            while received < sent:
+                self.results.get()
+                received += 1
+
+    def _to_tensors(self, batch):
+        """
+        Parameters
+        ----------
+        batch : dict[str, ND array]
+            [T, N, ...] -- data items
+
+        Returns
+        -------
+        dict[str, Tensor]
+            [T, N, ...] -- data items in network layout
+        """
+        tensors = dict()
+
+        if torch.cuda.is_available():
+            # copies from the previous buffer have been enqueued by now
+            event = self.pinned_events[self.pinned_slot] = torch.cuda.Event()
+            event.record()
+
+            self.pinned_slot = (self.pinned_slot + 1) % len(self.pinned)
+            event = self.pinned_events[self.pinned_slot]
+            if event is not None:
+                event.synchronize()
+
+            pinned = self.pinned[self.pinned_slot]
+
+        for k, v in batch.items():
+            x = torch.from_numpy(v)
+
+            if x.ndim == 5:
+                x = x.permute(0, 1, 4, 2, 3)
+
+            if x.is_floating_point():
+                x = x.float()
+
+            x = x.contiguous()
+
+            if torch.cuda.is_available():
+                buffer = pinned.get(k)
+
+                if buffer is None or buffer.shape != x.shape or buffer.dtype != x.dtype:
+                    buffer = pinned[k] = torch.empty(x.shape, dtype=x.dtype).pin_memory()
+
+                x = buffer.copy_(x)
+
+            tensors[k] = x
+
+        return tensors
+
+    def _samples(self, training=True):
+        """
+        Parameters
+        ----------
+        training : bool
+            training or validation
+
+        Returns
+        -------
+        List[Tuple[List[hashable], List[1D array]]]
+            keys and indexes of each batch
+        List[bool] | None
+            reset flag of each batch, None if windows are independent
+        """
+        if self.windows > 1:
+            batches, resets = self._consecutive_samples(training)
+
+        else:
+            if self.sharded:
+                keys, indexes = self._sharded_samples(training)
+            else:
+                keys = self._random_keys(training)
+                indexes = [self._random_indexes(key) for key in keys]
+
+            batches = [
+                (keys[b : b + self.batch_size], indexes[b : b + self.batch_size])
+                for b in range(0, len(keys), self.batch_size)
+            ]
+            resets = None
+
+        return batches, resets
 
     def __call__(self, training=True, display_progress=True):
         """
@@ -122,16 +477,26 @@ class Batches(DatasetLoader):
         dict
             training or validation data
         """
-        keys = self._random_keys(training)
+        if training or self.validation_seed is None:
+            batches, resets = self._samples(training)
+            loads = self._load(batches)
 
-        if keys:
-            indexes = [self._random_indexes(key) for key in keys]
         else:
+            if self.validation is None:
+                with fork_rng(devices=[]):
+                    manual_seed(self.validation_seed)
+                    batches, resets = self._samples(training=False)
+
+                loads = [{k: np.array(v) for k, v in batch.items()} for batch in self._load(batches)]
+                self.validation = loads, resets
+
+            loads, resets = self.validation
+            batches = loads
+
+        if not batches:
             return
 
-        d = {item: [] for item in self.dataset.dataitems}
-        q = Queue(self.batch_size)
-        c = spawn(self._load, args=(q, keys, indexes), nprocs=1, join=False)
+        start = perf_counter()
 
         if display_progress:
             if training:
@@ -139,25 +504,44 @@ class Batches(DatasetLoader):
             else:
                 iterbar = tqdm(desc="Validation Batches", total=self.validation_size)
 
-        for b, _ in enumerate(keys):
+        try:
+            for b, batch in enumerate(loads):
 
-            for k, v in q.get().items():
-                d[k].append(v)
+                if display_progress:
+                    iterbar.update(n=1)
 
-            if (b + 1) % self.batch_size:
-                continue
+                self.timing["batches"] += 1
+                self.timing["frames"] += self.sample_size * next(iter(batch.values())).shape[1]
 
-            batch = {}
-            for k, v in d.items():
-                batch[k] = np.stack(v, axis=1)
-                v.clear()
+                if self.tensors:
+                    batch = self._to_tensors(batch)
 
-            if display_progress:
-                iterbar.update(n=1)
+                if resets is None:
+                    yield batch
+                else:
+                    yield dict(batch, reset=resets[b])
 
-            yield batch
+        finally:
+            self.timing["elapsed"] += perf_counter() - start
 
-        assert c.join()
+    def step(self):
+        """Perform an epoch step
+
+        Returns
+        -------
+        dict
+            epoch info (loader batches, frames, frames per second, queue wait and read time in seconds)
+        """
+        timing = self.timing
+        self.timing = dict.fromkeys(timing, 0)
+
+        return dict(
+            loader_batches=timing["batches"],
+            loader_frames=timing["frames"],
+            loader_fps=timing["frames"] / timing["elapsed"] if timing["elapsed"] else 0,
+            loader_wait=timing["wait"],
+            loader_read=timing["read"],
+        )
 
 
 # -- Miscellaneous Loaders --
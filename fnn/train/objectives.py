@@ -1,5 +1,6 @@
 import numpy as np
 import torch
+from time import perf_counter
 
 
 # -------------- Objective Bases --------------
@@ -30,6 +31,16 @@ class Objective:
         """
         raise NotImplementedError()
 
+    def profile(self, mode=True):
+        """Enable or disable timing of objective calls, reported by step
+
+        Parameters
+        ----------
+        mode : bool
+            enable (True) or disable (False) timing
+        """
+        return
+
 
 # -------------- Objective Types --------------
 
@@ -52,7 +63,7 @@ class NetworkObjective(Objective):
 class NetworkLoss(NetworkObjective):
     """Network Loss"""
 
-    def __init__(self, sample_stream=True, burnin_frames=0):
+    def __init__(self, sample_stream=True, burnin_frames=0, clip=False):
         """
         Parameters
         ----------
@@ -60,11 +71,16 @@ class NetworkLoss(NetworkObjective):
             sample stream during training
         burnin_frames : int
             number of initial frames to discard
+        clip : bool
+            run the feedforward core over all frames at once or frame by frame
         """
         assert burnin_frames >= 0
 
         self.sample_stream = bool(sample_stream)
         self.burnin_frames = int(burnin_frames)
+        self.clip = bool(clip)
+        self.stream = None
+        self.timing = None
 
         self.log = dict(
             training_objective=[],
@@ -73,7 +89,22 @@ class NetworkLoss(NetworkObjective):
             validation_regularize=[],
         )
 
-    def __call__(self, units, stimuli, perspectives=None, modulations=None, training=True):
+    def profile(self, mode=True):
+        """Enable or disable timing of the forward and backward passes, synchronized with the network device
+
+        Parameters
+        ----------
+        mode : bool
+            enable (True) or disable (False) timing
+        """
+        self.timing = dict(forward_time=0, backward_time=0) if mode else None
+
+    def _clock(self):
+        if self.network.device.type == "cuda":
+            torch.cuda.synchronize(self.network.device)
+        return perf_counter()
+
+    def __call__(self, units, stimuli, perspectives=None, modulations=None, training=True, reset=True):
         """Perform an objective call
 
         Parameters
@@ -86,21 +117,34 @@ class NetworkLoss(NetworkObjective):
             either singular or batch
         training : bool
             training or validation
+        reset : bool
+            reset the network state, or continue the (detached) state and stream of the previous call
         """
-        if training and self.sample_stream:
-            stream = torch.randint(0, self.network.streams, (1,)).item()
+        if reset:
+            if training and self.sample_stream:
+                self.stream = torch.randint(0, self.network.streams, (1,)).item()
+            else:
+                self.stream = None
         else:
-            stream = None
+            self.network.detach()
+
+        if self.timing is not None:
+            t = self._clock()
 
         losses = self.network.generate_loss(
             units=units,
             stimuli=stimuli,
             perspectives=perspectives,
             modulations=modulations,
-            stream=stream,
+            stream=self.stream,
             training=training,
+            reset=reset,
+            clip=self.clip,
         )
-        losses = list(losses)[self.burnin_frames :]
+        losses = list(losses)
+
+        if reset:
+            losses = losses[self.burnin_frames :]
 
         regs = self.network.regularize()
         if regs:
@@ -110,10 +154,20 @@ class NetworkLoss(NetworkObjective):
             regs = None
             rsum = torch.tensor(0)
 
+        if self.timing is not None:
+            self.timing["forward_time"] += self._clock() - t
+
         if training:
             objective = torch.stack(losses).mean() + rsum
+
+            if self.timing is not None:
+                t = self._clock()
+
             objective.backward()
 
+            if self.timing is not None:
+                self.timing["backward_time"] += self._clock() - t
+
             obj = "training_objective"
             reg = "training_regularize"
 
@@ -153,6 +207,10 @@ class NetworkLoss(NetworkObjective):
                 ret[key] = np.stack(self.log[key], 0).mean(0)
                 self.log[key].clear()
 
+        if self.timing is not None:
+            ret.update(self.timing)
+            self.timing = dict.fromkeys(self.timing, 0)
+
         return ret
 
 
@@ -180,9 +238,10 @@ class StimulusObjective(Objective):
             self.unit_index = None
         else:
             try:
-                self.unit_index = int(unit_index)
+                unit_index = [int(unit_index)]
             except:
-                self.unit_index = list(map(int, unit_index))
+                unit_index = list(map(int, unit_index))
+            self.unit_index = torch.tensor(unit_index, dtype=torch.long, device=self.network.device)
 
         self.log = dict(
             training_loss=[],
@@ -321,20 +380,15 @@ class Reconstruction(StimulusObjective):
                     stimulus=expand(stimulus),
                     perspective=perspective,
                     modulation=modulation,
-                    unit=unit,
+                    unit=unit if self.unit_index is None else unit[:, self.unit_index],
                     stream=stream,
+                    unit_index=self.unit_index,
                 )
 
                 if frame < self.burnin_frames:
                     continue
 
-                elif self.unit_index is None:
-                    loss = loss.mean()
-
-                else:
-                    loss = loss[:, self.unit_index].mean()
-
-                losses.append(loss)
+                losses.append(loss.mean())
 
             assert frame + 1 == self.frames, "Unexpected number of frames"
 
@@ -429,14 +483,12 @@ class Excitation(StimulusObjective):
                     perspective=self.perspective,
                     modulation=self.modulation,
                     stream=stream,
+                    unit_index=self.unit_index,
                 )
 
                 if frame < self.burnin_frames:
                     continue
 
-                if self.unit_index is not None:
-                    out = out[:, self.unit_index]
-
                 loss = out.pow(-self.temperature).mean()
                 losses.append(loss)
 
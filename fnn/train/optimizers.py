@@ -1,4 +1,5 @@
 import torch
+from time import perf_counter
 
 
 # -------------- Optimizer Base --------------
@@ -38,7 +39,7 @@ class Optimizer:
         """
         raise NotImplementedError()
 
-    def optimize(self, loader, objective, parameters, groups=None):
+    def optimize(self, loader, objective, parameters, groups=None, sink=None, profile=None):
         """
         Parameters
         ----------
@@ -50,6 +51,11 @@ class Optimizer:
             mapping of parameters
         groups : None | List[fnn.train.parallel.ParameterGroup]
             none or list of parameter groups
+        sink : Callable[[dict], None] | None
+            none or callable that receives the epoch number and optimization info of each epoch
+        profile : bool | None
+            time the objective and step with device synchronization (True) or not (False),
+            defaults to whether a sink is given (None)
 
         Yields
         ------
@@ -76,7 +82,7 @@ class RandomOptimizer(Optimizer):
         """
         self.seed = int(seed)
 
-    def optimize(self, loader, objective, parameters, groups=None):
+    def optimize(self, loader, objective, parameters, groups=None, sink=None, profile=None):
         """
         Parameters
         ----------
@@ -88,20 +94,36 @@ class RandomOptimizer(Optimizer):
             mapping of parameters
         groups : None | Iterable[fnn.train.parallel.ParameterGroup]
             None | parameter groups
+        sink : Callable[[dict], None] | None
+            None | callable that receives dict(epoch=epoch, **info) of each epoch
+        profile : bool | None
+            time the objective and step with device synchronization (True) or not (False),
+            defaults to whether a sink is given (None)
 
         Yields
         ------
         int
             epoch number
         dict
-            optimization info (seed, hyperparameters, and objectives)
+            optimization info (seed, hyperparameters, objectives, loader info, and timing in seconds)
         """
         parameters = dict(parameters)
         groups = [] if groups is None else list(groups)
         devices = list(range(torch.cuda.device_count()))
 
+        profile = sink is not None if profile is None else bool(profile)
+        objective.profile(profile)
+
+        def clock():
+            if devices:
+                torch.cuda.synchronize()
+            return perf_counter()
+
         while self.scheduler.step():
 
+            start = perf_counter()
+            timing = dict(objective_time=0, step_time=0) if profile else dict()
+
             epoch = self.scheduler.epoch
             seed = self.scheduler.seed + self.seed
             hyperparameters = self.scheduler(**self.hyperparameters)
@@ -116,18 +138,35 @@ class RandomOptimizer(Optimizer):
 
                     for data in loader(training=training):
 
+                        if profile:
+                            t = clock()
+
                         objective(training=training, **data)
 
+                        if profile:
+                            timing["objective_time"] += clock() - t
+
                         if training:
 
+                            if profile:
+                                t = clock()
+
                             for g in groups:
                                 g.sync_grads()
 
                             self.step(parameters, **hyperparameters)
 
+                            if profile:
+                                timing["step_time"] += clock() - t
+
             objectives = objective.step()
+            info = dict(seed=seed, **hyperparameters, **objectives, **loader.step(), **timing)
+            info["epoch_time"] = perf_counter() - start
+
+            if sink is not None:
+                sink(dict(epoch=epoch, **info))
 
-            yield epoch, dict(seed=seed, **hyperparameters, **objectives)
+            yield epoch, info
 
 
 class SgdClip(RandomOptimizer):
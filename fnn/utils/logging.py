@@ -1,3 +1,4 @@
+import json
 import logging
 import time
 
@@ -27,3 +28,23 @@ def get_logger(name: str) -> logging.Logger:
         logger.setLevel(logging.INFO)
         logger.propagate = False            # important: avoid double logging via root
     return logger
+
+
+class JsonLines:
+    """
+    Structured log sink that appends each record as one line of JSON,
+    e.g. `optimizer.optimize(..., sink=JsonLines("metrics.jsonl"))`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, record: dict):
+        record = dict(time=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), **record)
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record, default=_to_json) + "\n")
+
+
+def _to_json(x):
+    """Converts numpy and torch scalars and arrays to JSON-serializable types."""
+    return x.tolist() if hasattr(x, "tolist") else str(x)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+"""
+Compare stimulus read throughput of raw and zlib compressed training data.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+from fnn.data import load_training_data, pack_training_data, load_packed_training_data
+from fnn.utils import logging
+
+logger = logging.get_logger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def disk_size(paths):
+    return sum(p.stat().st_size for p in paths if p.is_file())
+
+
+def benchmark(dataset, sample_size, reads, seed=0):
+    """
+    Parameters
+    ----------
+    dataset : fnn.data.dataset.Dataset
+        dataset to read from
+    sample_size : int
+        number of samples in a read window
+    reads : int
+        number of random windows to read
+
+    Returns
+    -------
+    float
+        frames per second
+    float
+        megabytes per second (decoded)
+    """
+    rng = np.random.default_rng(seed)
+    keys = dataset.df.index[rng.integers(0, len(dataset.df), reads)]
+    starts = [rng.integers(0, dataset.df.samples[k] - sample_size + 1) for k in keys]
+
+    nbytes = 0
+    t = time.perf_counter()
+    for key, start in zip(keys, starts):
+        nbytes += np.array(dataset.df.stimuli[key][start : start + sample_size]).nbytes
+    t = time.perf_counter() - t
+
+    return reads * sample_size / t, nbytes / t / 2**20
+
+
+def main(args):
+    logger.info(f"Loading dataset from {args.directory}")
+
+    with tempfile.TemporaryDirectory(dir=args.workdir) as tmpdir:
+        packed = Path(tmpdir) / "packed"
+        compressed = Path(tmpdir) / "compressed"
+
+        pack_training_data(args.directory, packed, max_items=args.max_items)
+        pack_training_data(
+            args.directory,
+            compressed,
+            max_items=args.max_items,
+            compress=["stimuli"],
+            chunk_size=args.chunk_size,
+            delta=args.delta,
+            level=args.level,
+        )
+
+        datasets = {
+            "NpyFile": load_training_data(args.directory, max_items=args.max_items, copy=True),
+            "MmapNpyFile": load_training_data(args.directory, max_items=args.max_items),
+            "NpySlice": load_packed_training_data(packed),
+            "ZlibSlice": load_packed_training_data(compressed),
+        }
+        raw_size = disk_size([packed / "stimuli.npy"])
+        zlib_size = disk_size(compressed.glob("stimuli.*"))
+
+        logger.info(f"Stimuli size: raw {raw_size / 2**20:.1f} MB, zlib {zlib_size / 2**20:.1f} MB")
+        logger.info(f"Compression ratio: {raw_size / zlib_size:.2f}")
+
+        for name, dataset in datasets.items():
+            fps, mbps = benchmark(dataset, args.sample_size, args.reads)
+            logger.info(f"{name:>12}: {fps:10.0f} frames/s, {mbps:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark compressed stimulus storage.")
+    parser.add_argument("directory", type=Path, help="Path to training data directory")
+    parser.add_argument("--max-items", type=int, default=None, help="Maximum number of trials to use")
+    parser.add_argument("--sample-size", type=int, default=100, help="Number of frames in a read window")
+    parser.add_argument("--reads", type=int, default=1000, help="Number of random windows to read")
+    parser.add_argument("--chunk-size", type=int, default=10, help="Number of frames in a compressed chunk")
+    parser.add_argument("--delta", action="store_true", help="Store frame differences in compressed chunks")
+    parser.add_argument("--level", type=int, default=6, help="zlib compression level")
+    parser.add_argument("--workdir", type=Path, default=None, help="Directory for temporary packed data")
+    args = parser.parse_args()
+    main(args)
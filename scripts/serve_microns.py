@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+
+"""
+Serve MICrONS scan models on localhost or a Unix socket.
+"""
+
+import argparse
+from pathlib import Path
+from fnn.microns import scan
+from fnn.serve import Server
+from fnn.utils import logging
+
+logger = logging.get_logger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def main(args):
+    networks = dict()
+
+    for session, scan_idx in args.scan:
+        logger.info(f"Loading scan {session}-{scan_idx} from {args.directory}")
+        networks[f"{session}-{scan_idx}"], _ = scan(session, scan_idx, cuda=not args.cpu, directory=args.directory)
+
+    address = str(args.socket) if args.socket else (args.host, args.port)
+
+    server = Server(networks, address=address, batch_size=args.batch_size)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve MICrONS scan models.")
+    parser.add_argument("--scan", type=int, nargs=2, action="append", required=True, metavar=("SESSION", "SCAN_IDX"))
+    parser.add_argument("--directory", type=Path, default=None, help="Directory of model parameters and metadata")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="HTTP host")
+    parser.add_argument("--port", type=int, default=8000, help="HTTP port")
+    parser.add_argument("--socket", type=Path, default=None, help="Unix socket path, instead of HTTP host and port")
+    parser.add_argument("--batch-size", type=int, default=None, help="Maximum number of requests per step")
+    parser.add_argument("--cpu", action="store_true", help="Do not use cuda")
+    args = parser.parse_args()
+    main(args)
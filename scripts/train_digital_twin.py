@@ -100,7 +100,9 @@ def main(args):
     ):
         epochs.append(epoch)
         metrics.append(info_dict)
-    
+
+    loader.close()
+
     # SAVE DATA
     logger.info("Saving training metrics and model checkpoint.")
 